@@ -1,32 +1,4 @@
-import sys
-import os
-from PyQt6.QtWidgets import QApplication
-from vehicle_gui import VEHICLE_DIR
-from vehicle_gui.main_widget import VehicleGUI
-import signal
-
-signal.signal(signal.SIGINT, signal.SIG_DFL)
-
-os.makedirs(VEHICLE_DIR, exist_ok=True)
-
-def main():
-    app = QApplication(sys.argv)
-    # Set application style
-    app.setStyle("Fusion")
-    
-    try:
-        editor = VehicleGUI()
-        editor.show()
-        exit_code = app.exec()
-        
-        # Use os._exit to avoid Python cleanup that causes segfaults
-        os._exit(exit_code)
-        
-    except Exception as e:
-        print(f"Error during application execution: {e}")
-        import traceback
-        traceback.print_exc()
-        os._exit(1)
+from vehicle_gui.__main__ import main
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
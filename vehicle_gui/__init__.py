@@ -1,6 +1,4 @@
-import os
+from vehicle_gui.paths import VEHICLE_DIR
 from vehicle_gui.counter_example_view.base_renderer import BaseRenderer
 
-__all__ = ["BaseRenderer"]
-
-VEHICLE_DIR = os.path.join(os.path.expanduser("~"), ".vehicle", "GUI")
\ No newline at end of file
+__all__ = ["BaseRenderer", "VEHICLE_DIR"]
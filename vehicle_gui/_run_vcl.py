@@ -6,10 +6,13 @@ This is a stop-gap until we develop a threaded solution inside of the Vehicle co
 """
 
 from vehicle_lang.session import Session
-from vehicle_gui.vcl_bindings import CACHE_DIR
 import sys
 import os
 
+# Run as a script, so this directory is first on sys.path: import the sibling paths module directly,
+# since going through vehicle_gui would load the whole GUI package (PyQt6, numpy) in every worker process
+from paths import CACHE_DIR
+
 if __name__ == "__main__":
 	# Get the command line arguments
 	args = sys.argv[1:]
@@ -18,7 +21,7 @@ if __name__ == "__main__":
 	s = Session().__enter__()
 
 	# Run the command and get the output
-	log_path = os.path.join(os.path.dirname(__file__), CACHE_DIR, "log.txt")
+	log_path = os.path.join(CACHE_DIR, "log.txt")
 	try:
 		s.check_call(
 			[
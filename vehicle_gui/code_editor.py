@@ -1,42 +1,144 @@
 from PyQt6.QtWidgets import QPlainTextEdit, QWidget, QToolTip
-from PyQt6.QtCore import Qt, QRect, QSize
+from PyQt6.QtCore import Qt, QRect, QSize, QTimer, QEvent
 from PyQt6.QtGui import QColor, QPainter, QFontDatabase
-from PyQt6.QtGui import QPen, QTextCharFormat
-from superqt.utils import CodeSyntaxHighlight
+from PyQt6.QtGui import QPen, QTextCharFormat, QTextBlockUserData, QPalette, QSyntaxHighlighter, QTextDocument, QFont
+from pygments.lexers import find_lexer_class, get_lexer_by_name
+from pygments.styles import get_style_by_name
+from pygments.util import ClassNotFound
 from collections import defaultdict
+from functools import lru_cache
 
+MONO_FAMILIES = ["Menlo", "Courier New", "Courier", "Monaco", "Consolas", "Andale Mono",
+                 "Source Code Pro", "Ubuntu Mono", "monospace"]
 
-class ExtendedSyntaxHighlight(CodeSyntaxHighlight):
-    """Syntax highlighter for Vehicle language with error highlighting"""
+# Lines longer than this (generated specs, embedded data) are left unhighlighted
+MAX_HIGHLIGHT_LINE = 16384
+
+
+@lru_cache(maxsize=32)
+def _lexer_for(lang):
+    """Resolve a Pygments lexer once per process; lookups scan the installed plugin entry points"""
+    try:
+        return get_lexer_by_name(lang)
+    except ClassNotFound as e:
+        if cls := find_lexer_class(lang):
+            return cls()
+        raise ValueError(f"Could not find lexer for language {lang!r}.") from e
+
+
+def _char_format(style: dict) -> QTextCharFormat:
+    """Build the QTextCharFormat for one Pygments token style"""
+    char_format = QTextCharFormat()
+    if style.get("mono"):
+        char_format.setFontFamilies(MONO_FAMILIES)
+    if style.get("color"):
+        char_format.setForeground(QColor(f"#{style['color']}"))
+    if style.get("bgcolor"):
+        char_format.setBackground(QColor(f"#{style['bgcolor']}"))
+    if style.get("bold"):
+        char_format.setFontWeight(QFont.Weight.Bold)
+    if style.get("italic"):
+        char_format.setFontItalic(True)
+    if style.get("underline"):
+        char_format.setFontUnderline(True)
+    return char_format
+
+
+@lru_cache(maxsize=None)
+def _theme_formats(theme):
+    """Build a theme's token formats and background color once, shared by every highlighter"""
+    style = get_style_by_name(theme)
+    return {token: _char_format(token_style) for token, token_style in style}, style.background_color
+
+
+class TokenCache(QTextBlockUserData):
+    """Token spans lexed for a block, reused while the block's text and theme are unchanged"""
+    def __init__(self, text_hash, styles, spans):
+        super().__init__()
+        self.text_hash = text_hash      # A hash rather than a copy, so the cache does not double the document's memory
+        self.styles = styles
+        self.spans = spans
+
+
+class ExtendedSyntaxHighlight(QSyntaxHighlighter):
+    """Pygments syntax highlighter for Vehicle language with error highlighting"""
     def __init__(self, parent, lang, theme):
         self.line_errors = defaultdict(list)
-        super().__init__(parent, lang, theme)
+        self.default_format = QTextCharFormat()
+        # A widget parent (rather than its document) also gets the theme's background color
+        self._doc_parent = None
+        if not isinstance(parent, QTextDocument) and callable(getattr(parent, "document", None)):
+            self._doc_parent = parent
+            parent = parent.document()
+        super().__init__(parent)
+        self.setLanguage(lang)
+        self.setTheme(theme)
 
         # Squiggle format for errors
         self.error_format = QTextCharFormat()
         self.error_format.setUnderlineColor(QColor("red"))
         self.error_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.SpellCheckUnderline)
 
+        # Error updates arrive in bursts (clear, then add), so coalesce them into one pass over the touched lines
+        self._dirty_lines = set()
+        self._rehighlight_timer = QTimer(self)
+        self._rehighlight_timer.setSingleShot(True)
+        self._rehighlight_timer.setInterval(80)
+        self._rehighlight_timer.timeout.connect(self._rehighlight_dirty)
+
     def set_errors(self, errors: list[dict]):
         """Set the list of errors to highlight"""
+        if not errors and not self.line_errors:
+            return      # No errors before or after, so no line needs rehighlighting
+        self._dirty_lines.update(self.line_errors)
         self.line_errors.clear()
         for err in  errors:
             line = err["provenance"]["contents"][0]
             self.line_errors[line].append(err)
+        self._dirty_lines.update(self.line_errors)
+        self._rehighlight_timer.start()
+
+    def _rehighlight_dirty(self):
+        """Rehighlight only the lines whose errors were added or removed"""
+        lines, self._dirty_lines = self._dirty_lines, set()
+        document = self.document()
+        if document is None:
+            return      # Detached; attaching again rehighlights everything
+        for line in sorted(lines):
+            block = document.findBlockByNumber(line - 1)
+            if block.isValid():
+                self.rehighlightBlock(block)
+
+    def setLanguage(self, lang):
+        """Set the language, sharing one lexer instance per language"""
+        self.lexer = _lexer_for(lang)
+
+    def setTheme(self, theme):
+        """Set the theme, reusing the token formats already built for it"""
+        self.styles, self.background_color = _theme_formats(theme)
+        if self._doc_parent is not None:
+            palette = self._doc_parent.palette()
+            palette.setColor(QPalette.ColorRole.Base, QColor(self.background_color))
+            self._doc_parent.setPalette(palette)
         self.rehighlight()
 
     def highlightBlock(self, text):
         """Highlight the current block, adding error highlights if needed"""
-        super().highlightBlock(text)
-        if not text: return
+        if not text or len(text) > MAX_HIGHLIGHT_LINE: return
 
-        block_number = self.currentBlock().blockNumber() + 1
+        # Lexing is line-local, so a block whose text is unchanged keeps its tokens
+        styles = self.styles
+        text_hash = hash(text)
+        cache = self.currentBlockUserData()
+        if isinstance(cache, TokenCache) and cache.text_hash == text_hash and cache.styles is styles:
+            spans = cache.spans
+        else:
+            spans = self._token_spans(text, styles)
+            self.setCurrentBlockUserData(TokenCache(text_hash, styles, spans))
+        for start, length, fmt in spans:
+            self.setFormat(start, length, fmt)
 
-        # Reset formatting
-        current_format = self.format(0)
-        combined_format = QTextCharFormat(current_format)
-        combined_format.setUnderlineStyle(QTextCharFormat.UnderlineStyle.NoUnderline)
-        self.setFormat(0, len(text), combined_format)
+        block_number = self.currentBlock().blockNumber() + 1
 
         for err in self.line_errors.get(block_number, []):
             start_line, start_col, end_line, end_col = err["provenance"]["contents"]
@@ -56,9 +158,34 @@ class ExtendedSyntaxHighlight(CodeSyntaxHighlight):
                 continue                                                    # No error on this line
             
             # Apply error formatting
-            length = max(0, end_idx - start_idx + 1)
-            combined_format.merge(self.error_format)
-            self.setFormat(start_idx, length, combined_format)
+            self._underline(spans, start_idx, end_idx + 1)
+
+    def _token_spans(self, text, styles):
+        """Lex the block once, returning (start, length, format) spans with adjacent equal formats merged"""
+        spans = []
+        # The lexer expects newline-terminated input (line comments match up to the newline)
+        for index, token, value in self.lexer.get_tokens_unprocessed(text + "\n"):
+            length = min(len(value), len(text) - index)
+            if length <= 0:
+                continue
+            fmt = styles.get(token, self.default_format)
+            if spans:
+                last_start, last_length, last_fmt = spans[-1]
+                # Runs such as identifiers separated by whitespace share a format, so one setFormat covers them
+                if last_start + last_length == index and (last_fmt is fmt or last_fmt == fmt):
+                    spans[-1] = (last_start, last_length + length, last_fmt)
+                    continue
+            spans.append((index, length, fmt))
+        return spans
+
+    def _underline(self, spans, start, end):
+        """Merge the error squiggle into every token overlapping [start, end)"""
+        for token_start, length, fmt in spans:
+            lo, hi = max(start, token_start), min(end, token_start + length)
+            if lo < hi:
+                combined_format = QTextCharFormat(fmt)
+                combined_format.merge(self.error_format)
+                self.setFormat(lo, hi - lo, combined_format)
 
             
 class CodeEditor(QPlainTextEdit):
@@ -71,8 +198,13 @@ class CodeEditor(QPlainTextEdit):
         mono.setPointSize(14)
         self.setFont(mono)
 
-        # Create inline line-number area
+        # Create inline line-number area; its width only changes with the digit count or the font
         self.line_number_area = QWidget(self)
+        self._width_digits = 0
+        self._digit_advance = self.fontMetrics().horizontalAdvance('9')     # Refreshed on FontChange
+        self._line_number_width = 0
+        self._margin_width = -1            # Left viewport margin currently applied
+        self._last_line_rect = QRect()     # Viewport band last painted with the current-line rules
 
         # Bind the size hint and paint events
         self.line_number_area.sizeHint = lambda: QSize(self.line_number_area_width(), 0)
@@ -89,6 +221,7 @@ class CodeEditor(QPlainTextEdit):
 
         # Syntax highlighting
         self.highlighter = ExtendedSyntaxHighlight(self.document(), lang, theme)
+        self.highlighting_enabled = True
         self.setMouseTracking(True)
         self.viewport().installEventFilter(self)
 
@@ -117,6 +250,14 @@ class CodeEditor(QPlainTextEdit):
         
         return super().eventFilter(obj, event)
 
+    def set_highlighting(self, enabled: bool):
+        """Attach or detach the syntax highlighter; detached, the document is shown as plain text"""
+        if enabled == self.highlighting_enabled:
+            return
+        self.highlighting_enabled = enabled
+        # Attaching schedules a full rehighlight of the document
+        self.highlighter.setDocument(self.document() if enabled else None)
+
     def add_errors(self, errors: list[dict]):
         self.highlighter.set_errors(errors)
 
@@ -125,28 +266,41 @@ class CodeEditor(QPlainTextEdit):
 
     def line_number_area_width(self):
         """Calculate the width of the line number area"""
-        digits = 1
-        max_num = max(1, self.blockCount())
-        while max_num >= 10:
-            max_num //= 10
-            digits += 1
-        space = self.fontMetrics().horizontalAdvance('9') * digits
-        padding = 4
-        return space + 2 * padding
+        digits = len(str(max(1, self.blockCount())))
+        if digits != self._width_digits:
+            self._width_digits = digits
+            padding = 4
+            self._line_number_width = self._digit_advance * digits + 2 * padding
+        return self._line_number_width
 
     def update_line_number_area_width(self, new_block_count):
         """Update the margin according to the line number area width"""
-        self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
+        width = self.line_number_area_width()
+        if width == self._margin_width:
+            return      # Full-viewport update requests arrive on every scroll and edit; relayout only on change
+        self._margin_width = width
+        self.setViewportMargins(width, 0, 0, 0)
+        cr = self.contentsRect()
+        self.line_number_area.setGeometry(QRect(cr.left(), cr.top(), width, cr.height()))
 
     def update_line_number_area(self, rect, dy):
         """Update the line number area when needed"""
         if dy:
             self.line_number_area.scroll(0, dy)
+            self._last_line_rect.translate(0, dy)     # The viewport scrolled the rules along with the text
         else:
             self.line_number_area.update(0, rect.y(), self.line_number_area.width(), rect.height())
         if rect.contains(self.viewport().rect()):
             self.update_line_number_area_width(0)
 
+    def changeEvent(self, event):
+        """Re-measure the line number digits when the editor font changes"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange and hasattr(self, "line_number_area"):
+            self._digit_advance = self.fontMetrics().horizontalAdvance('9')
+            self._width_digits = 0
+            self.update_line_number_area_width(0)
+
     def resizeEvent(self, event):
         """Handle resize event"""
         super().resizeEvent(event)
@@ -158,22 +312,26 @@ class CodeEditor(QPlainTextEdit):
         painter = QPainter(self.line_number_area)
         # Draw line numbers in the same monospaced font
         painter.setFont(self.font())
+        painter.setPen(QColor(150, 150, 150))
+        # Loop invariants: the dirty band and the text box every number is drawn in
+        rect_top = event.rect().top()
+        rect_bottom = event.rect().bottom()
+        padding = 4
+        text_width = self.line_number_area.width() - 2 * padding
+        line_height = self.fontMetrics().height()
         block = self.firstVisibleBlock()
         block_number = block.blockNumber()
         top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
         bottom = top + self.blockBoundingRect(block).height()
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(block_number + 1)
-                painter.setPen(QColor(150, 150, 150))
-                padding = 4
+        while block.isValid() and top <= rect_bottom:
+            if block.isVisible() and bottom >= rect_top:
                 painter.drawText(
                     padding,
                     int(top),
-                    self.line_number_area.width() - 2 * padding,
-                    self.fontMetrics().height(),
+                    text_width,
+                    line_height,
                     Qt.AlignmentFlag.AlignRight,
-                    number
+                    str(block_number + 1)
                 )
             block = block.next()
             top = bottom
@@ -181,8 +339,13 @@ class CodeEditor(QPlainTextEdit):
             block_number += 1
 
     def highlight_current_line(self):
-        """Trigger repaint to draw horizontal rules around the current line"""
-        self.viewport().update()
+        """Trigger repaint of the bands around the old and new current line to redraw the rules"""
+        block = self.textCursor().block()
+        top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
+        height = self.blockBoundingRect(block).height()
+        rect = QRect(0, int(top) - 2, self.viewport().width(), int(height) + 4)
+        self.viewport().update(rect.united(self._last_line_rect))
+        self._last_line_rect = rect
 
     def paintEvent(self, event):
         """Paint editor normally, then draw rules above and below the current line"""
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QTextEdit
+from PyQt6.QtWidgets import QWidget, QLabel, QVBoxLayout, QPlainTextEdit
 from PyQt6.QtGui import QPixmap, QImage
 from PyQt6.QtCore import Qt
 from typing import Optional, Dict
+from collections import OrderedDict
+import weakref
 import numpy as np
 
 
@@ -24,32 +26,97 @@ class BaseRenderer(ABC):
         """Subclasses must provide a name property."""
         pass
 
+    def clear_cache(self):
+        """Drop any tensors kept from earlier renders. Renderers that cache per tensor override this."""
+        pass
+
 
 class GSImageRenderer(BaseRenderer):
     # Constant for maximum display height
     MAX_DISPLAY_HEIGHT = 300
+    # Upscaling also stops at this width, so a single-row tensor is not blown up 300-fold
+    MAX_DISPLAY_WIDTH = 800
+    # Number of scaled pixmaps kept for revisiting counterexamples
+    PIXMAP_CACHE_SIZE = 32
     
     def __init__(self):
         self._widget = QLabel()
+        self._pixmap_cache = OrderedDict()  # id(data) -> (weakref to data, scaled pixmap), least recently shown first
 
     def _prepare_pixmap(self, data: np.ndarray) -> QPixmap:
+        # Drop unit axes (e.g. a 1x28x28 batch or 28x28x1 channel); squeeze returns a view, not a copy
+        data = np.squeeze(data)
+        if data.ndim < 2:
+            data = data.reshape(1, -1)  # A single pixel or a vector is drawn as one row
+        if data.dtype.kind == 'f':
+            data = self._stretch_to_uint8(data)
+        # Already uint8 and C-contiguous (the IDX decode result) is used as-is; anything else is converted once
+        data = np.ascontiguousarray(data, dtype=np.uint8)
         h, w = data.shape
-        qimage = QImage(data.copy().data, w, h, w, QImage.Format_Grayscale8)
-        return QPixmap.fromImage(qimage)
-
-    def render(self, data: np.ndarray):
-        pixmap = self._prepare_pixmap(data)
-        
-        # Calculate scale factor based on max display height
-        original_height = pixmap.height()
-        scale_factor = self.MAX_DISPLAY_HEIGHT / original_height
-        scale_factor = max(1.0, scale_factor)  
-        scaled_pixmap = pixmap.scaled(
-            int(pixmap.width() * scale_factor), 
-            int(pixmap.height() * scale_factor),
+        # Pass the row stride explicitly so Qt reads exactly the rows NumPy laid out
+        qimage = QImage(data.data, w, h, data.strides[0], QImage.Format.Format_Grayscale8)
+        # Scale the image rather than the pixmap (scaling a QPixmap round-trips it through a QImage),
+        # then convert once
+        scale_factor = max(1.0, min(self.MAX_DISPLAY_HEIGHT / h, self.MAX_DISPLAY_WIDTH / w))
+        scaled_image = qimage.scaled(
+            int(w * scale_factor),
+            int(h * scale_factor),
             Qt.AspectRatioMode.KeepAspectRatio,
             Qt.TransformationMode.SmoothTransformation
         )
+        if scaled_image.size() == qimage.size():
+            # scaled() to the same size shares `data`'s buffer, which is freed once this returns, and
+            # fromImage need not copy an unconverted image; detach before the pixmap is cached
+            scaled_image = qimage.copy()
+        return QPixmap.fromImage(scaled_image, Qt.ImageConversionFlag.NoFormatConversion)
+
+    @staticmethod
+    def _stretch_to_uint8(data: np.ndarray) -> np.ndarray:
+        """Linearly map a float tensor's finite [min, max] onto [0, 255], using a single float temporary."""
+        finite = np.isfinite(data)
+        all_finite = bool(finite.all())
+        if all_finite:
+            vmin, vmax = float(data.min()), float(data.max())
+        elif finite.any():
+            # Solvers can emit NaN or ±inf; stretch over the finite values only
+            vmin, vmax = float(data[finite].min()), float(data[finite].max())
+        else:
+            vmin = vmax = 0.0
+        # Scale before offsetting, from halves of the range, so extremes such as ±1e308 cannot overflow
+        half_span = vmax / 2 - vmin / 2
+        factor = 127.5 / half_span if half_span > 0 else 0.0
+        # float32 for float16/32 input; float64 input keeps its range
+        with np.errstate(over='ignore', invalid='ignore'):
+            scaled = np.multiply(data, factor, dtype=np.result_type(data.dtype, np.float32))
+            scaled -= vmin * factor
+        if not all_finite:
+            # NaN and -inf show as black, +inf as white (set here, as inf * 0 for a constant image is NaN)
+            scaled[~finite] = 0.0
+            scaled[np.isposinf(data)] = 255.0
+        return scaled.astype(np.uint8)
+
+    def clear_cache(self):
+        self._pixmap_cache.clear()
+
+    def render(self, data: np.ndarray):
+        # The entry only weakly references the array, so the cache never keeps a decoded tensor alive;
+        # a live reference to `data` itself confirms the id was not reused by another tensor
+        cached = self._pixmap_cache.get(id(data))
+        if cached is not None and cached[0]() is data:
+            self._pixmap_cache.move_to_end(id(data))
+            self.widget.setPixmap(cached[1])
+            return
+
+        # Check the tensor up front, so an unsuitable one is reported in the view rather than raised
+        if data.dtype.kind not in 'uif' or data.size == 0 or data.squeeze().ndim > 2:
+            self.widget.setText(f"Grayscale image rendering needs a non-empty numeric tensor of at most "
+                                f"2 non-unit axes, got shape {data.shape} ({data.dtype})")
+            return
+
+        scaled_pixmap = self._prepare_pixmap(data)
+        self._pixmap_cache[id(data)] = (weakref.ref(data), scaled_pixmap)
+        if len(self._pixmap_cache) > self.PIXMAP_CACHE_SIZE:
+            self._pixmap_cache.popitem(last=False)
         self.widget.setPixmap(scaled_pixmap)
 
     @property
@@ -62,14 +129,33 @@ class GSImageRenderer(BaseRenderer):
 
 class TextRenderer(BaseRenderer):
     """Renderer for text data."""
+    TEXT_CACHE_SIZE = 32
+
     def __init__(self):
-        self._widget = QTextEdit()
+        # Plain-text layout with no undo history; array2string already breaks its own lines
+        self._widget = QPlainTextEdit()
         self._widget.setReadOnly(True)
+        self._widget.setUndoRedoEnabled(False)
+        self._widget.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self._text_cache = OrderedDict()  # id(data) -> (weakref to data, formatted text), least recently shown first
+
+    def clear_cache(self):
+        self._text_cache.clear()
 
     def render(self, data: np.ndarray):
-        with np.printoptions(precision=3, threshold=20, suppress=True):
-            string_rept = str(data)
-            self.widget.setText(string_rept)
+        # As in GSImageRenderer, entries weakly reference the array and match on identity
+        cached = self._text_cache.get(id(data))
+        if cached is not None and cached[0]() is data:
+            self._text_cache.move_to_end(id(data))
+            self.widget.setPlainText(cached[1])
+            return
+
+        # threshold summarises large tensors, so the text stays a few lines whatever the tensor size
+        string_rept = np.array2string(np.asarray(data), precision=3, threshold=20, suppress_small=True)
+        self._text_cache[id(data)] = (weakref.ref(data), string_rept)
+        if len(self._text_cache) > self.TEXT_CACHE_SIZE:
+            self._text_cache.popitem(last=False)
+        self.widget.setPlainText(string_rept)
 
     @property
     def widget(self) -> QWidget:
@@ -1,81 +1,173 @@
-import idx2numpy
 import os
 import time
+import struct
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QComboBox, QLabel, QTextEdit, QStackedLayout,
-    QPushButton, QFileDialog, QHBoxLayout, QSizePolicy
+    QWidget, QVBoxLayout, QComboBox, QLabel, QStackedLayout,
+    QPushButton, QHBoxLayout, QSizePolicy, QLineEdit, QCheckBox,
+    QFrame, QScrollArea
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-from typing import List, Type, Dict
+from PyQt6.QtCore import Qt, pyqtSignal
+from typing import Dict
 from collections import defaultdict
+from pathlib import Path
 
 from vehicle_gui.vcl_bindings import CACHE_DIR
 from vehicle_gui.counter_example_view.base_renderer import *
-
-
-from pathlib import Path
-
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, QLineEdit, QCheckBox, QFrame, QScrollArea
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QFileDialog
-
 from vehicle_gui.counter_example_view.extract_renderers import load_renderer_classes
 from vehicle_gui.counter_example_view.base_renderer import TextRenderer, GSImageRenderer
+from vehicle_gui.util import get_open_file_name
 from vehicle_gui import VEHICLE_DIR
 
 RENDERERS_DIR = Path(VEHICLE_DIR) / "renderers"
 
+# IDX data larger than this (bytes) is memory-mapped; smaller tensors are read in one go
+IDX_MMAP_THRESHOLD = 1024 * 1024
+
+# Decoded tensors kept for revisiting; only these stay in memory (renderer caches hold them weakly)
+IDX_CACHE_SIZE = 8
+
+# IDX type codes (third magic byte) to their big-endian NumPy dtypes
+IDX_DTYPES = {
+    0x08: np.dtype('>u1'),
+    0x09: np.dtype('>i1'),
+    0x0B: np.dtype('>i2'),
+    0x0C: np.dtype('>i4'),
+    0x0D: np.dtype('>f4'),
+    0x0E: np.dtype('>f8'),
+}
 
-def _wait_until_stable_size(path: str, checks: int = 3, interval: float = 0.05) -> bool:
+
+def _wait_until_stable_size(entry: os.DirEntry, checks: int = 3, interval: float = 0.05):
     """
-    Return True if the file's size is stable over a series of checks.
+    Return the file's final stat result if its size is stable over a series of checks, else None.
     """
     try:
-        last = os.path.getsize(path)
+        # The first check reuses the stat the directory scan can provide
+        last = entry.stat().st_size
         if last <= 4:
-            return False
+            return None
         for _ in range(checks - 1):
             time.sleep(interval)
-            now = os.path.getsize(path)
+            now = os.stat(entry.path).st_size
             if now != last:
                 last = now
         time.sleep(interval)
-        return os.path.getsize(path) == last and last > 4
+        st = os.stat(entry.path)
+        return st if st.st_size == last and last > 4 else None
     except FileNotFoundError:
-        return False
+        return None
+
+
+def _scan_counter_example_files(cache_dir: str) -> list:
+    """List (key, DirEntry) for every IDX file in the assignment directories."""
+    # scandir entries carry their file type, so filtering needs no extra stat per entry
+    files = []
+    with os.scandir(cache_dir) as subdirs:
+        for subdir in subdirs:
+            if not subdir.name.endswith("-assignments") or not subdir.is_dir():
+                continue
+            with os.scandir(subdir.path) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    # Empty or still-being-written files (no complete IDX header) cannot be decoded
+                    try:
+                        if entry.stat().st_size <= 4:
+                            continue
+                    except OSError:
+                        continue
+                    var_name = entry.name.strip('\"')
+                    files.append((f"{subdir.name}-{var_name}", entry)) # e.g. prop1-assignments-varA
+    return files
+
+
+def find_counter_examples(cache_dir: str = CACHE_DIR) -> dict:
+    """Map each counterexample key to its IDX file path, without reading any of the files."""
+    return {key: entry.path for key, entry in _scan_counter_example_files(cache_dir)}
+
+
+def load_counter_example(path: str) -> np.ndarray:
+    """Decode one counterexample IDX file, reusing the decoded array while the file is unchanged."""
+    st = os.stat(path)
+    return _load_idx(path, st.st_mtime_ns, st.st_size)
 
 
 def decode_counter_examples(cache_dir: str = CACHE_DIR) -> dict:
     """Decode counterexamples from IDX files in assignment directories."""
-    subdirs = [
-        d for d in os.listdir(cache_dir)
-        if os.path.isdir(os.path.join(cache_dir, d)) and d.endswith("-assignments")
-    ]
+    files = _scan_counter_example_files(cache_dir)
 
+    # Each file spends most of its time waiting for a stable size and reading, so decode them concurrently
     counter_examples = {}
-    for subdir in subdirs:
-        subdir_path = os.path.join(cache_dir, subdir)
-        for filename in os.listdir(subdir_path):
-            full_path = os.path.join(subdir_path, filename)
-            if not os.path.isfile(full_path):
-                continue
-
-            if not _wait_until_stable_size(full_path, checks=4, interval=0.05):
-                continue
-
-            var_name = filename.strip('\"')
-            key = f"{subdir}-{var_name}" # e.g. prop1-assignments-varA
-            try:
-                tensors = idx2numpy.convert_from_file(full_path)
+    if not files:
+        return counter_examples
+    errors = []
+    # Mostly sleeping and I/O, so oversubscribe the cores, but never start more workers than files
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        decoded = executor.map(_decode_idx, (entry for _, entry in files))
+        for (key, entry), (tensors, error) in zip(files, decoded):
+            if tensors is not None:
                 counter_examples[key] = tensors
-            except Exception as e:
-                print(f"Error decoding {full_path}: {e}")
+            elif error is not None:
+                errors.append(f"{entry.path}: {error}")
 
+    # Report failures once after the pool has finished, rather than printing from every worker
+    if errors:
+        print(f"Error decoding {len(errors)} of {len(files)} counterexample files:\n  " + "\n  ".join(errors))
     return counter_examples
 
 
+def _decode_idx(entry: os.DirEntry):
+    """Decode a single IDX file once it has finished being written, returning (tensor, error)."""
+    st = _wait_until_stable_size(entry, checks=4, interval=0.05)
+    if st is None:
+        return None, None   # Missing or still being written; not an error
+    try:
+        # Keyed on mtime and size too, so a file rewritten by the next verify run is loaded afresh
+        return _load_idx(entry.path, st.st_mtime_ns, st.st_size), None
+    except Exception as e:
+        return None, e
+
+
+def split_counter_example_key(key: str):
+    """Split a '<property>-assignments-<variable>' key into (property, variable)."""
+    prop_name, _, var_name = key.partition("-assignments-")
+    return prop_name, var_name
+
+
+def _parse_idx_header(path: str):
+    """Read an IDX header, returning (data offset, dtype, shape)."""
+    with open(path, 'rb') as f:
+        zero1, zero2, type_code, ndim = struct.unpack('>BBBB', f.read(4))
+        if zero1 or zero2 or type_code not in IDX_DTYPES:
+            raise ValueError(f"{path} is not an IDX file")
+        shape = struct.unpack(f'>{ndim}I', f.read(4 * ndim))
+    return 4 + 4 * ndim, IDX_DTYPES[type_code], shape
+
+
+@lru_cache(maxsize=IDX_CACHE_SIZE)
+def _load_idx(path: str, mtime_ns: int, size: int) -> np.ndarray:
+    """Load an IDX file's data as a read-only array; large files are mapped and paged in as rendered."""
+    offset, dtype, shape = _parse_idx_header(path)
+    expected = offset + dtype.itemsize * int(np.prod(shape, dtype=np.int64))
+    if size != expected:
+        raise ValueError(f"{path} has {size} bytes, expected {expected} for shape {shape}")
+    if expected == offset:
+        return np.empty(shape, dtype=dtype)     # Nothing to map
+    if size - offset > IDX_MMAP_THRESHOLD:
+        return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=shape)
+    # Small tensors (the usual case) cost less to read than to map, and hold no mapping on the file
+    array = np.fromfile(path, dtype=dtype, offset=offset).reshape(shape)
+    if not dtype.isnative:
+        # IDX is big-endian; swap the fresh buffer once here so renderers never convert it per view
+        array = array.byteswap(inplace=True).view(dtype.newbyteorder('='))
+    array.flags.writeable = False   # Shared through the cache, like the read-only memmaps
+    return array
+
+
 class VariableBox(QWidget):
     """Widget for variable renderer selection"""
     renderer_changed = pyqtSignal(str, object)  # variable_name, renderer_obj
@@ -157,8 +249,8 @@ class VariableBox(QWidget):
             print(f"Error setting renderer {selection}: {e}")
     
     def _load_from_path(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, f"Load Renderer for {self.variable_name}", "", "Renderer modules (*.py);;All Files (*)"
+        file_path, _ = get_open_file_name(
+            self, f"Load Renderer for {self.variable_name}", "Renderer modules (*.py);;All Files (*)"
         )
         if file_path:
             try:
@@ -166,8 +258,14 @@ class VariableBox(QWidget):
                 if renderer_classes:
                     if len(renderer_classes) > 1:
                         print(f"Warning: Multiple renderer classes found in {file_path}. Using the first one.")
-                    renderer = renderer_classes[0]
-                    self._set_renderer(renderer, f"Custom: {Path(file_path).name}", file_path, "Load Custom Renderer...")
+                    renderer = renderer_classes[0]()
+                    # List it above "Load From Path..." so it can be picked again without reloading
+                    if renderer.name not in self.renderer_map:
+                        self.renderer_combo.blockSignals(True)
+                        self.renderer_combo.insertItem(self.renderer_combo.count() - 1, renderer.name)
+                        self.renderer_combo.blockSignals(False)
+                    self.renderer_map[renderer.name] = renderer
+                    self._set_renderer(renderer)
                 else:
                     self._set_renderer_error("No valid renderer class found in the selected file")
             except Exception as e:
@@ -178,7 +276,12 @@ class VariableBox(QWidget):
         """Common method to set a renderer class and update UI."""
         self.renderer = renderer
         self.display_box.setText(renderer.name)
-        self.renderer_combo.setCurrentText(renderer.__class__.__name__)
+        # Reflect the choice (e.g. when synced from another variable) without re-entering _on_renderer_changed
+        label = next((text for text, r in self.renderer_map.items() if type(r) is type(renderer)), None)
+        if label is not None:
+            self.renderer_combo.blockSignals(True)
+            self.renderer_combo.setCurrentText(label)
+            self.renderer_combo.blockSignals(False)
         self.renderer_changed.emit(self.variable_name, renderer)
     
     def _set_renderer_error(self, error_message):
@@ -233,16 +336,6 @@ class PropertyBox(QFrame):
 
         self.layout().addWidget(self.var_container)
 
-    def _on_property_toggled(self, state):
-        checked = state == Qt.CheckState.Checked
-        self.property_toggled.emit(self.prop_data['name'], checked)
-    
-    def is_checked(self):
-        return self.prop_checkbox.isChecked()
-    
-    def set_checked(self, checked):
-        self.prop_checkbox.setChecked(checked)
-
 
 class RendererLoader(QWidget):
     renderers_changed = pyqtSignal()  # emitted when any variable renderer changes
@@ -281,27 +374,31 @@ class RendererLoader(QWidget):
         prop_names = defaultdict(set)
 
         for key in counter_examples.keys():
-            key_parts = key.split('-')
-            prop_name, _, var_name = key_parts
+            prop_name, var_name = split_counter_example_key(key)
             prop_names[prop_name].add(var_name)
         
-        # Clear existing widgets
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        # Lay out and paint the list once, after all widgets are in place
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing widgets
+            while self.content_layout.count():
+                item = self.content_layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
         
-        # Create property widgets
-        for prop_name in prop_names:
-            prop_widget = PropertyBox(prop_name, renderer_loader=self, parent=self)
-            prop_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-            self.content_layout.addWidget(prop_widget)
-            self.property_widgets[prop_name] = prop_widget
-
-        # Add variables to each property
-        for prop_name, var_names in prop_names.items():
-            for var_name in var_names:
-                self.property_widgets[prop_name].add_variable(var_name)
+            # Create property widgets
+            for prop_name in prop_names:
+                prop_widget = PropertyBox(prop_name, renderer_loader=self, parent=self)
+                prop_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+                self.content_layout.addWidget(prop_widget)
+                self.property_widgets[prop_name] = prop_widget
+
+            # Add variables to each property
+            for prop_name, var_names in prop_names.items():
+                for var_name in var_names:
+                    self.property_widgets[prop_name].add_variable(var_name)
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
     
     def _on_variable_renderer_changed(self, variable_name, renderer):
         """Handle when a variable's renderer selection changes."""
@@ -331,6 +428,13 @@ class RendererLoader(QWidget):
     def property_items(self):
         return [(name, widget) for name, widget in self.property_widgets.items()]
     
+    def all_renderers(self):
+        """Return every renderer instance offered by the variable boxes, selected or not."""
+        return [renderer
+                for prop_widget in self.property_widgets.values()
+                for var_widget in prop_widget.variable_widgets.values()
+                for renderer in var_widget.renderer_map.values()]
+
     def get_variable_renderers(self):
         """Return a dict of property_name-variable_name -> renderer for all variables."""
         renderers = {}
@@ -348,11 +452,14 @@ class CounterExampleWidget(QWidget):
     def __init__(self, parent=None):
         """Initialize the counterexample widget. Modes is a dict of variable names to lists of renderers supported for that variable."""
         super().__init__(parent)
-        self.data_map = {}
         self.renderers = {}
-        self.var_index = {}
-        self.ce_paths = []
+        self.views = {}  # "<property>-<variable>" -> (renderer, stack index), rebuilt per set_modes
+        # (key, IDX file path, "<property>-<variable>" view key) per counterexample, built once per data load;
+        # tensors are decoded only when first shown
+        self.ce_items = ()
         self.ce_current_index = 0
+        self._last_rendered = None  # (key, renderer, data) last drawn, to skip redrawing the same view
+        self._reported_missing = set()  # view keys already reported as having no renderer
         self.parent_ref = parent
 
         # Navigation controls
@@ -393,43 +500,51 @@ class CounterExampleWidget(QWidget):
         if len(modes) == 0:
             return
         
-        # Rebuild stack
-        while self.stack.count():
-            widget = self.stack.takeAt(0).widget()
-            if widget:
+        # Same renderer for every variable: the stack and the display are already current
+        if modes.keys() == self.renderers.keys() and all(
+                modes[var_name] is renderer for var_name, renderer in self.renderers.items()):
+            return
+
+        # Only detach widgets of renderers that were replaced, rather than rebuilding the whole stack
+        wanted = {renderer.widget for renderer in modes.values()}
+        for ind in reversed(range(self.stack.count())):
+            widget = self.stack.widget(ind)
+            if widget not in wanted:
+                self.stack.removeWidget(widget)
                 widget.setParent(None)
 
-        self.var_index = {}
+        self.views = {}
         self.renderers = {}
+        self._reported_missing.clear()
 
-        ind = 0
         for var_name, renderer in modes.items():
-            self.stack.addWidget(renderer.widget)
-            self.var_index[var_name] = ind
+            ind = self.stack.indexOf(renderer.widget)
+            if ind < 0:
+                ind = self.stack.addWidget(renderer.widget)
+            self.views[var_name] = (renderer, ind)
             self.renderers[var_name] = renderer
-            ind += 1
         
         # If we have data and just got renderers, update the display
-        if len(modes) > 0 and self.ce_paths:
+        if len(modes) > 0 and self.ce_items:
             self.update_display()
 
-    def set_data(self, data: dict):
-        """Set the counterexample data."""
-        self.data_map = data
-        self.ce_paths = list(data.keys())
+    def set_data(self, files: dict):
+        """Set the counterexamples to browse, as a map of key to IDX file path."""
+        self.ce_items = tuple(
+            (key, path, "-".join(split_counter_example_key(key))) for key, path in files.items()
+        )
         self.ce_current_index = 0
-        if self.ce_paths:
-            self._update_current_names()
+        self._last_rendered = None
         
         # Only update display if we have data, otherwise wait for renderers
-        if self.ce_paths and len(self.renderers) > 0:
+        if self.ce_items and len(self.renderers) > 0:
             self.update_display()
-        elif not self.ce_paths:
+        elif not self.ce_items:
             self.update_display()  # Clear display when no data
 
     def update_display(self):
         """Update the display based on current data and mode."""
-        if not self.ce_paths:
+        if not self.ce_items:
             self.name_label.setText("No data")
             self.prev_button.hide()
             self.next_button.hide()
@@ -438,56 +553,49 @@ class CounterExampleWidget(QWidget):
         self.prev_button.show()
         self.next_button.show()
 
-        key = self.ce_paths[self.ce_current_index]
-        content = self.data_map.get(key, [])
-        self.name_label.setText(f"{key}")
+        key, path, compound_key = self.ce_items[self.ce_current_index]
+        self.name_label.setText(key)    # The key is already the display name; no per-click formatting
 
         # Render the data for the current variable if it has a renderer
-        compound_key = f"{self.current_prop_name}-{self.current_var_name}"
-        
-        if compound_key in self.renderers:
-            renderer = self.renderers[compound_key]
+        view = self.views.get(compound_key)
+        if view is not None:
+            renderer, stack_index = view
             try:
-                renderer.render(content)
-                self.stack.setCurrentIndex(self.var_index[compound_key])
+                # Only the counterexample on display is decoded; _load_idx keeps recently viewed ones
+                content = load_counter_example(path)
+            except Exception as e:
+                # Show the failure in place rather than printing it on every visit
+                self.name_label.setText(f"{key} (could not decode: {e})")
+                return
+            try:
+                # Wrapping round to the counterexample already drawn (e.g. only one loaded) needs no re-render
+                last = self._last_rendered
+                if last is None or last[0] != key or last[1] is not renderer or last[2] is not content:
+                    renderer.render(content)
+                    self._last_rendered = (key, renderer, content)
+                self.stack.setCurrentIndex(stack_index)
             except Exception as e:
                 print(f"Error during rendering: {e}")
         else:
-            # No renderer available for this variable
-            print(f"No renderer available for {compound_key}")
+            # No renderer available for this variable; say so once, not on every navigation click
+            if compound_key not in self._reported_missing:
+                self._reported_missing.add(compound_key)
+                print(f"No renderer available for {compound_key}")
 
     def _go_previous(self):
         """Navigate to previous counterexample."""
-        if self.ce_current_index > 0:
-            self.ce_current_index -= 1
-        else:
-            self.ce_current_index = len(self.ce_paths) - 1
-
-        # Update property and variable names
-        self._update_current_names()
+        if not self.ce_items:
+            return
+        self.ce_current_index = (self.ce_current_index - 1) % len(self.ce_items)
         self.update_display()
 
     def _go_next(self):
         """Navigate to next counterexample."""
-        if self.ce_current_index < len(self.ce_paths) - 1:
-            self.ce_current_index += 1
-        else:
-            self.ce_current_index = 0
-        
-        # Update property and variable names
-        self._update_current_names()
+        if not self.ce_items:
+            return
+        self.ce_current_index = (self.ce_current_index + 1) % len(self.ce_items)
         self.update_display()
 
-    def _update_current_names(self):
-        """Update current property and variable names based on current counterexample."""
-        key = self.ce_paths[self.ce_current_index]
-        key_parts = key.split('-')
-
-        # Find the assignments part and extract property and variable
-        assignments_idx = key_parts.index('assignments')
-        self.current_prop_name = '-'.join(key_parts[:assignments_idx])
-        self.current_var_name = '-'.join(key_parts[assignments_idx + 1:])
-
 
 class CounterExampleTab(QWidget):
     """Main tab widget for counterexample visualization."""
@@ -500,8 +608,9 @@ class CounterExampleTab(QWidget):
 
         # Folder display
         self.folder_label = QLabel(CACHE_DIR)
-        counter_examples_json = decode_counter_examples(CACHE_DIR)
         control_layout.addWidget(self.folder_label)
+        # Counterexamples left from a previous session are decoded when the tab is first shown, not at startup
+        self._loaded = False
         
         # Add control layout to main layout
         self.layout.addLayout(control_layout)
@@ -519,23 +628,39 @@ class CounterExampleTab(QWidget):
 
         # Content widget on the right side
         self.content_widget = CounterExampleWidget(parent=self)
-        self.content_widget.set_data(counter_examples_json)
+        self.content_widget.set_data({})
         main_horizontal_layout.addWidget(self.content_widget, 1)  # Give it stretch factor to take remaining space
 
         # Add the horizontal layout to main layout
         self.layout.addLayout(main_horizontal_layout)
         self.setLayout(self.layout)
 
+    def showEvent(self, event):
+        """Load the cached counterexamples the first time the tab is shown."""
+        super().showEvent(event)
+        if not self._loaded:
+            self.refresh_from_cache()
+
     def refresh_from_cache(self):
         """Re-read counter examples from the cache directory."""
+        self._loaded = True
         if os.path.exists(CACHE_DIR):
-            counter_examples = decode_counter_examples(CACHE_DIR)
+            # Only list the files here; each tensor is decoded when it is first displayed
+            counter_examples = find_counter_examples(CACHE_DIR)
             self.property_loader.load_properties(counter_examples)
             self.content_widget.set_data(counter_examples)
             self._on_renderers_changed()
         else:
             print(f"Cache directory {CACHE_DIR} does not exist")
 
+    def release_cached_tensors(self):
+        """Drop the decoded tensors, so none still maps a cache file that is about to be removed."""
+        self.content_widget.set_data({})
+        # Renderer caches hold the arrays they drew, including those of renderers not currently selected
+        for renderer in (*self.property_loader.all_renderers(), *self.content_widget.renderers.values()):
+            renderer.clear_cache()
+        _load_idx.cache_clear()
+
     def _on_renderers_changed(self):
         """Handle when renderers change in the property loader."""
         variable_renderers = self.property_loader.get_variable_renderers()
@@ -1,5 +1,7 @@
+import os
 import importlib.util
 import inspect
+from functools import lru_cache
 from typing import Type
 from pathlib import Path
 from vehicle_gui.counter_example_view.base_renderer import BaseRenderer
@@ -7,14 +9,23 @@ from vehicle_gui.counter_example_view.base_renderer import BaseRenderer
 
 def load_renderer_classes(path: str) -> list[Type[BaseRenderer]]:
     """Load renderer class types from a Python file without instantiating them."""
+    # Every variable box asks for the same plugin files, so each file is executed once until it changes
+    return list(_load_renderer_classes(str(path), os.stat(path).st_mtime_ns))
+
+
+@lru_cache(maxsize=128)
+def _load_renderer_classes(path: str, mtime_ns: int) -> tuple:
     path = Path(path)
     spec = importlib.util.spec_from_file_location(path.stem, path)
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     renderer_classes = []
 
-    for _, obj in inspect.getmembers(module, inspect.isclass):
-        if issubclass(obj, BaseRenderer) and obj is not BaseRenderer:
+    # Only classes defined in the plugin itself; renderers it imports (e.g. the built-ins) are not its own.
+    # Reading the namespace directly also avoids getmembers evaluating every attribute.
+    for obj in vars(module).values():
+        if (inspect.isclass(obj) and obj.__module__ == module.__name__
+                and issubclass(obj, BaseRenderer) and obj is not BaseRenderer):
             renderer_classes.append(obj)
 
     return renderer_classes
\ No newline at end of file
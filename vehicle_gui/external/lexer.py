@@ -3,98 +3,105 @@
 import pygments.lexer
 from pygments.token import *
 __all__ = ["ExternalLexer"]
+
+# Patterns for every rule that yields a Name token, in BNFC rule order. They are
+# joined into one alternation so the lexer runs a single compiled regex per
+# position instead of trying each rule in turn; ordered alternation keeps the
+# first-rule-wins semantics of the original rule list.
+_NAME_PATTERNS = [
+    r'True|False',
+    r'(\d)+',
+    r'(\d)+\.(\d)+',
+    r'@(network|dataset|parameter|property|tensor)',
+    r'@postulate',
+    r'\{',
+    r'\}',
+    r'->',
+    r'forallT',
+    r'if',
+    r'then',
+    r'else',
+    r'\.',
+    r':',
+    r'\\',
+    r'let',
+    r'Type',
+    r'Unit',
+    r'Bool',
+    r'Index',
+    r'Nat',
+    r'Real',
+    r'List',
+    r'Vector',
+    r'Tensor',
+    r'forall',
+    r'exists',
+    r'foreach',
+    r'=>',
+    r'and',
+    r'or',
+    r'not',
+    r'==',
+    r'!=',
+    r'<=',
+    r'<',
+    r'>=',
+    r'>',
+    r'==\.',
+    r'!=\.',
+    r'<=\.',
+    r'<\.',
+    r'>=\.',
+    r'>\.',
+    r'\*',
+    r'/',
+    r'\+',
+    r'-',
+    r'min',
+    r'max',
+    r'nil',
+    r'::',
+    r'\[',
+    r'\]',
+    r'!',
+    r'map',
+    r'fold',
+    r'reduceOr',
+    r'reduceAnd',
+    r'reduceAdd',
+    r'reduceMul',
+    r'reduceMin',
+    r'reduceMax',
+    r'HasLeq',
+    r'HasEq',
+    r'HasNotEq',
+    r'HasAdd',
+    r'HasSub',
+    r'HasMul',
+    r'HasFold',
+    r'HasMap',
+    r'IsTensorType',
+    r'name',
+    r'infer',
+    r'[a-zA-Z](_|\d|[a-zA-Z])*',
+    r'\?(_|\d|[a-zA-Z])*',
+    r'\.[a-zA-Z](_|\d|[a-zA-Z])*',
+    r'[a-zA-Z]([a-zA-Z]|\d|_|\')*',
+]
+_NAME_RE = '|'.join(f'(?:{p})' for p in _NAME_PATTERNS)
+
 class ExternalLexer(pygments.lexer.RegexLexer):
     name = 'External'
     aliases = ['external']
     KEYWORDS = ['in', 'record', 'type', 'where']
-    def get_tokens_unprocessed(self, text):
-        for index, token, value in super(ExternalLexer,self).get_tokens_unprocessed(text):
-            if token is Name and value in self.KEYWORDS:
-                yield index, Keyword, value
-            else:
-                yield index, token, value
+    # Keywords are matched by the compiled rules rather than by re-checking every Name
+    # token afterwards; the lookahead keeps them from matching identifier prefixes
     tokens = {
         'root': [
             (r'--.*\n', Comment),
             (r'\{-((.)(?<!-))*-((.)(?<![-\}])((.)(?<!-))*-|-)*\}', Comment),
-            (r'True|False', Name),
-            (r'(\d)+', Name),
-            (r'(\d)+\.(\d)+', Name),
-            (r'@(network|dataset|parameter|property|tensor)', Name),
-            (r'@postulate', Name),
-            (r'\{', Name),
-            (r'\}', Name),
-            (r'->', Name),
-            (r'forallT', Name),
-            (r'if', Name),
-            (r'then', Name),
-            (r'else', Name),
-            (r'\.', Name),
-            (r':', Name),
-            (r'\\', Name),
-            (r'let', Name),
-            (r'Type', Name),
-            (r'Unit', Name),
-            (r'Bool', Name),
-            (r'Index', Name),
-            (r'Nat', Name),
-            (r'Real', Name),
-            (r'List', Name),
-            (r'Vector', Name),
-            (r'Tensor', Name),
-            (r'forall', Name),
-            (r'exists', Name),
-            (r'foreach', Name),
-            (r'=>', Name),
-            (r'and', Name),
-            (r'or', Name),
-            (r'not', Name),
-            (r'==', Name),
-            (r'!=', Name),
-            (r'<=', Name),
-            (r'<', Name),
-            (r'>=', Name),
-            (r'>', Name),
-            (r'==\.', Name),
-            (r'!=\.', Name),
-            (r'<=\.', Name),
-            (r'<\.', Name),
-            (r'>=\.', Name),
-            (r'>\.', Name),
-            (r'\*', Name),
-            (r'/', Name),
-            (r'\+', Name),
-            (r'-', Name),
-            (r'min', Name),
-            (r'max', Name),
-            (r'nil', Name),
-            (r'::', Name),
-            (r'\[', Name),
-            (r'\]', Name),
-            (r'!', Name),
-            (r'map', Name),
-            (r'fold', Name),
-            (r'reduceOr', Name),
-            (r'reduceAnd', Name),
-            (r'reduceAdd', Name),
-            (r'reduceMul', Name),
-            (r'reduceMin', Name),
-            (r'reduceMax', Name),
-            (r'HasLeq', Name),
-            (r'HasEq', Name),
-            (r'HasNotEq', Name),
-            (r'HasAdd', Name),
-            (r'HasSub', Name),
-            (r'HasMul', Name),
-            (r'HasFold', Name),
-            (r'HasMap', Name),
-            (r'IsTensorType', Name),
-            (r'name', Name),
-            (r'infer', Name),
-            (r'[a-zA-Z](_|\d|[a-zA-Z])*', Name),
-            (r'\?(_|\d|[a-zA-Z])*', Name),
-            (r'\.[a-zA-Z](_|\d|[a-zA-Z])*', Name),
-            (r'[a-zA-Z]([a-zA-Z]|\d|_|\')*', Name),
+            (pygments.lexer.words(KEYWORDS, suffix=r"(?![_\da-zA-Z])"), Keyword),
+            (_NAME_RE, Name),
             (r'@0|\(|\)|\{|\}|\{\{|\}\}|=|,|\(\)|;', Operator),
             (r'(\d)+', Number.Integer),
             (r'(\d)+\.(\d)+(e(-)?(\d)+)?', Number.Float),
@@ -1,17 +1,17 @@
 import os
-import site
+import re
+import html
+import mmap
 import traceback 
 import asyncio
-from PyQt6.QtWidgets import (QMainWindow, QTextEdit, QVBoxLayout, QPushButton, QWidget,
-                             QLabel, QFileDialog, QHBoxLayout, QStatusBar, QMessageBox,
-                             QScrollArea, QSizePolicy, QToolBar, QFrame, QSplitter,
+from PyQt6.QtWidgets import (QMainWindow, QPlainTextEdit, QVBoxLayout, QPushButton, QWidget,
+                             QLabel, QHBoxLayout, QStatusBar, QMessageBox,
+                             QSizePolicy, QToolBar, QFrame, QSplitter,
                              QTabWidget, QProgressBar, QApplication, QComboBox)
 from PyQt6.QtCore import Qt, QRunnable, pyqtSlot, QObject, pyqtSignal, QThreadPool, QTimer
 from PyQt6.QtGui import QFontDatabase, QIcon, QTextCursor
-from superqt.utils import CodeSyntaxHighlight
 import functools
 from typing import Callable
-from pathlib import Path
 import json
 import math
 from datetime import datetime
@@ -23,14 +23,20 @@ from vehicle_gui.counter_example_view.counter_example_tab import CounterExampleT
 from vehicle_gui.resource_view.input_view import InputView
 from vehicle_gui.resource_view.property_view import PropertyView
 from vehicle_gui.vcl_bindings import CACHE_DIR
-from vehicle_gui.util import which_all
+from vehicle_gui.util import which_all, get_open_file_name, get_save_file_name
 
-from vehicle_gui.counter_example_view.counter_example_tab import decode_counter_examples
+from vehicle_gui.counter_example_view.counter_example_tab import decode_counter_examples, split_counter_example_key
 
 from vehicle_lang import VERSION 
 
 RELEASE_VERSION = "0.1.3"
 
+MMAP_READ_THRESHOLD = 1024 * 1024   # Files above this size (bytes) are memory-mapped for reading
+LOG_MAX_BLOCKS = 10000              # Oldest output lines are dropped beyond this
+
+_JSON_DECODER = json.JSONDecoder()
+_WARNING_RE = re.compile("warning", re.IGNORECASE)
+
 class OperationSignals(QObject):
     """
     Defines signals to communicate from worker thread to main GUI thread.
@@ -74,7 +80,45 @@ class OperationWorker(QRunnable):
             else:
                 self.signals.finished.emit(1)
 
-    
+
+class FileReadSignals(QObject):
+    """
+    Defines signals to hand a read file from the worker thread to the main GUI thread.
+    """
+    loaded = pyqtSignal(str, str, int)   # file_path, text, size in bytes
+    failed = pyqtSignal(str, str)        # file_path, error message
+
+
+class FileReadWorker(QRunnable):
+    def __init__(self, file_path: str, signals: FileReadSignals):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = signals
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            data, size = read_text(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        if '\r' in data:
+            data = data.replace('\r\n', '\n').replace('\r', '\n')     # Universal newlines, as text mode gave
+        self.signals.loaded.emit(self.file_path, data, size)
+
+
+def read_text(file_path):
+    """Read and decode a UTF-8 file, returning its text and size in bytes."""
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size <= MMAP_READ_THRESHOLD:
+            # Binary read: one read sized from fstat, then a single decode
+            return file.read().decode('utf-8'), size
+        # Large files decode straight from a read-only mapping, without a bytes copy of the file
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8'), size
+
+
 class VehicleGUI(QMainWindow):
     """Vehicle GUI"""
     def __init__(self):
@@ -82,6 +126,7 @@ class VehicleGUI(QMainWindow):
         self.stop_event = asyncio.Event()
         self.vcl_bindings = VCLBindings()
         self.vcl_path = None
+        self.vcl_basename = None    # Display name of vcl_path, recomputed only when the path changes
         self.verifier_paths = {}  # Store mapping of verifier display names to paths
         self.setWindowTitle("Vehicle GUI")
         self.setGeometry(100, 100, 1400, 800)
@@ -93,16 +138,32 @@ class VehicleGUI(QMainWindow):
         self.property_completed_queries = 0
         # Pause duration before starting next property (ms)
         self.property_pause_ms = 300
+        # Files larger than this (bytes) open without syntax highlighting
+        self.highlight_limit = 256 * 1024
          
         # Track if error dialog has been displayed
         self._error_shown = False
 
         self._waiting_transition = False
+        # Set by verify_spec so the verify step starts once its compile step succeeds
+        self._verify_after_compile = False
 
         self.thread_pool = QThreadPool()
         self.operation_signals = OperationSignals()
         self.operation_signals.output_chunk.connect(self._gui_process_output_chunk)
         self.operation_signals.finished.connect(self._gui_operation_finished)
+        # Files are read off the GUI thread; only the latest requested path is applied
+        self._pending_open = None
+        self.file_read_signals = FileReadSignals()
+        self.file_read_signals.loaded.connect(self._gui_file_loaded)
+        self.file_read_signals.failed.connect(self._gui_file_failed)
+
+        # Status messages are flushed once per event loop pass, so back-to-back updates paint once
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(0)
+        self._status_timer.timeout.connect(self._flush_status)
 
         self.show_ui()
 
@@ -116,6 +177,8 @@ class VehicleGUI(QMainWindow):
         file_toolbar.addAction(QIcon.fromTheme("document-new"), "New", self.new_file)
         file_toolbar.addAction(QIcon.fromTheme("document-open"), "Open", self.open_file)
         file_toolbar.addAction(QIcon.fromTheme("document-save"), "Save", self.save_file)
+        self.highlight_action = file_toolbar.addAction("Enable Highlighting", self.enable_highlighting)
+        self.highlight_action.setVisible(False)
 
         # Add a spacer to the toolbar. This will push the buttons to the right
         spacer = QWidget()
@@ -173,10 +236,7 @@ class VehicleGUI(QMainWindow):
         editor_console_splitter = QSplitter(Qt.Orientation.Vertical)
 
         # Create left editor 
-        self.editor = CodeEditor(lang="external", theme="vse-style")
-        mono = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-        mono.setPointSize(14)
-        self.editor.setFont(mono)
+        self.editor = CodeEditor(lang="external", theme="vse-style")     # Sets its own 14pt fixed-width font
         self.editor.setPlaceholderText("Enter your Vehicle specification here...")
         editor_console_splitter.addWidget(self.editor) # Add editor to splitter
 
@@ -186,9 +246,11 @@ class VehicleGUI(QMainWindow):
         console_font.setPointSize(12)
 
         # Create the Output tab in the console
-        self.log_console = QTextEdit()  # For "Output" tab
+        self.log_console = QPlainTextEdit()  # For "Output" tab; plain-text layout keeps long verifier logs cheap
         self.log_console.setFont(console_font)
         self.log_console.setReadOnly(True)
+        self.log_console.setUndoRedoEnabled(False)     # Read-only log; don't keep undo history for every append
+        self.log_console.setMaximumBlockCount(LOG_MAX_BLOCKS)
         self.console_tab_widget.addTab(self.log_console, "Output")
 
         # Add console to splitter
@@ -333,24 +395,48 @@ class VehicleGUI(QMainWindow):
     # --- File Operations ---
 
     def new_file(self):
+        self._pending_open = None       # Drop any file still being read
+        self.enable_highlighting()
         self.editor.clear()
         self.query_tab.clear()
         self.file_path_label.setText("No file opened")
-        self.status_bar.showMessage("New file created", 3000)
+        self.show_status("New file created", 3000)
         self.vcl_path = None
+        self.vcl_basename = None
         self.vcl_bindings.clear()
         self.input_view.clear_input_boxes()
 
     def open_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Open Vehicle Specification", "", "VCL Files (*.vcl);;All Files (*)"
+        file_path, _ = get_open_file_name(
+            self, "Open Vehicle Specification", "VCL Files (*.vcl);;All Files (*)"
         )
         if not file_path:
             return
+        # Reading (and decoding) happens on the thread pool so slow storage does not freeze the window
+        self._pending_open = file_path
+        self.show_status(f"Opening: {file_path}...")
+        self.thread_pool.start(FileReadWorker(file_path, self.file_read_signals))
+
+    def _gui_file_loaded(self, file_path, data, size):
+        """Show a file read by FileReadWorker and regenerate its inputs and properties."""
+        if file_path != self._pending_open:
+            return      # Superseded by a later open
+        self._pending_open = None
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                self.editor.setPlainText(file.read())
-            self.status_bar.showMessage(f"Opened: {file_path}", 3000)
+            # Highlighting a large document on load freezes the editor, so show it as plain text
+            highlight = size <= self.highlight_limit
+            self.editor.set_highlighting(highlight)
+            self.highlight_action.setVisible(not highlight)
+            # Repaint once after the whole document is in, not as blocks are laid out and highlighted
+            self.editor.setUpdatesEnabled(False)
+            try:
+                self.editor.setPlainText(data)
+            finally:
+                self.editor.setUpdatesEnabled(True)
+            if highlight:
+                self.show_status(f"Opened: {file_path}", 3000)
+            else:
+                self.show_status(f"Opened: {file_path} (syntax highlighting disabled for large file)", 5000)
             self.set_vcl_path(file_path)
 
             if not self.is_valid_vcl():
@@ -358,34 +444,50 @@ class VehicleGUI(QMainWindow):
             self.input_view.load_inputs(self.vcl_bindings)               # Regenerate resource inputs and properties
 
         except Exception as e: 
-            QMessageBox.critical(self, "Open File Error", f"Could not open file: {e}")
-            self.file_path_label.setText("Error opening file")
-            self.input_view.clear_input_boxes()         # Clear resources if file fails to load
+            self._open_failed(str(e))
+            return
 
         # Load properties
         self.regenerate_properties()
-    
+
+    def _gui_file_failed(self, file_path, message):
+        """Report a file FileReadWorker could not read."""
+        if file_path != self._pending_open:
+            return
+        self._pending_open = None
+        self._open_failed(message)
+
+    def _open_failed(self, message):
+        """Report a failed open and clear the inputs and properties of the previous file."""
+        self.show_status(None)
+        QMessageBox.critical(self, "Open File Error", f"Could not open file: {message}")
+        self.file_path_label.setText("Error opening file")
+        self.input_view.clear_input_boxes()         # Clear resources if file fails to load
+        self.regenerate_properties()
+
     def save_file(self):
         current_file_path = self.vcl_path
 
         # If no path, it's a "Save As"
         if not current_file_path:      
-            file_path, _ = QFileDialog.getSaveFileName(
-                self, "Save Vehicle Specification", "", "VCL Files (*.vcl);;All Files (*)"
+            file_path, _ = get_save_file_name(
+                self, "Save Vehicle Specification", "VCL Files (*.vcl);;All Files (*)"
             )
             if not file_path:
                 return False
             current_file_path = file_path
         try:
-            with open(current_file_path, 'w', encoding='utf-8') as file:
-                file.write(self.editor.toPlainText())
-            self.status_bar.showMessage(f"Saved: {current_file_path}", 3000)
+            # An unmodified document already matches the file on disk
+            if current_file_path != self.vcl_path or self.editor.document().isModified():
+                with open(current_file_path, 'wb') as file:
+                    file.write(self.editor.toPlainText().encode('utf-8'))
+                self.show_status(f"Saved: {current_file_path}", 3000)
             self.set_vcl_path(current_file_path)
             self.editor.document().setModified(False) 
         
         except Exception as e:
             QMessageBox.critical(self, "Save File Error", f"Could not save file: {e}")
-            self.append_to_problems(f"Error saving file: {e}")
+            self.append_to_log(f"Error saving file: {e}", color='red')
             self.input_view.clear_input_boxes()
             return False   
         
@@ -415,11 +517,16 @@ class VehicleGUI(QMainWindow):
             return reply == QMessageBox.StandardButton.Yes and self.save_file()
         return self.save_file()
     
+    def enable_highlighting(self):
+        """Re-attach syntax highlighting after it was disabled for a large file"""
+        self.editor.set_highlighting(True)
+        self.highlight_action.setVisible(False)
+
     # --- Verifier Management ---
 
     def load_verifier_from_file(self):
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, "Select Marabou Verifier", "", "Marabou Verifier (Marabou*);;All Files (*)"
+        file_path, _ = get_open_file_name(
+            self, "Select Marabou Verifier", "Marabou Verifier (Marabou*);;All Files (*)"
         )
         if not file_path:
             return
@@ -479,9 +586,8 @@ class VehicleGUI(QMainWindow):
     def _gui_process_output_chunk(self, tag: str, chunk: str):
         """Processes output chunks received from the worker thread."""
         if tag == "stderr":
-            # Distinguish warnings vs errors on stderr
-            text = chunk.strip()
-            if text.lower().startswith("warning") or "warning" in text.lower():
+            # Distinguish warnings vs errors on stderr (one case-insensitive scan of the chunk)
+            if _WARNING_RE.search(chunk):
                 # Log warnings in yellow without interrupting flow
                 self.append_to_log(chunk, color='yellow')
             else:
@@ -490,8 +596,15 @@ class VehicleGUI(QMainWindow):
             return
 
         if self.current_operation == 'verify' and tag == 'stdout':
-            # Parse JSON chunks for verify operations
-            self._process_json_chunk(chunk)
+            # Parse JSON chunks for verify operations. One chunk can log many events, so group
+            # their appends into a single document edit: one layout pass and one scroll per chunk
+            cursor = QTextCursor(self.log_console.document())
+            cursor.beginEditBlock()
+            try:
+                self._process_json_chunk(chunk)
+            finally:
+                cursor.endEditBlock()
+            self.log_console.ensureCursorVisible()
             return
         # Normal stdout: timestamped output
         self.append_to_log(chunk)
@@ -499,10 +612,12 @@ class VehicleGUI(QMainWindow):
     @pyqtSlot(int)
     def _gui_operation_finished(self, return_code: int):
         """Handles the completion of a VCL operation from the worker thread."""
+        verify_next = self._verify_after_compile and self.current_operation == "compile" and return_code == 0
+        self._verify_after_compile = False
         self.progress_bar.setVisible(False)  # Hide progress bar when operation completes
         # If an error dialog was shown during this operation, suppress success/failure logs and clear status
         if self._error_shown:
-            self.status_bar.clearMessage()
+            self.show_status(None)
             self.current_operation = None
             return
         self.compile_button.setEnabled(True)
@@ -512,7 +627,7 @@ class VehicleGUI(QMainWindow):
 
         if return_code == 0: # Success
             msg = f"{self.current_operation.capitalize()} completed successfully."
-            self.status_bar.showMessage(msg, 5000)
+            self.show_status(msg, 5000)
             self.append_to_log(f"\n--- {self.current_operation.capitalize()} finished successfully. ---")
             # If verify, list any failed properties and their queries
             if self.current_operation == 'verify':
@@ -522,8 +637,7 @@ class VehicleGUI(QMainWindow):
                         # Group failures by property name
                         groups = {}
                         for key, tensor in failures.items():
-                            # key format: '<property>-assignments-<var>'
-                            prop = key.split('-assignments-')[0]
+                            prop, _ = split_counter_example_key(key)
                             groups.setdefault(prop, []).append((key, tensor))
                         # Log each property's result
                         for prop, items in groups.items():
@@ -534,8 +648,8 @@ class VehicleGUI(QMainWindow):
                             # Show sample vector for each counterexample variable
                             for _, tensor in items:
                                 try:
-                                    flat = tensor.flatten()
-                                    sample = flat[:5].tolist()
+                                    # Index the first few elements in place rather than copying the whole tensor
+                                    sample = tensor.flat[:5].tolist()
                                     self.append_to_log(f"      x: {sample}", color='red')
                                 except Exception:
                                     self.append_to_log(f"      x: {tensor}", color='red')
@@ -545,7 +659,7 @@ class VehicleGUI(QMainWindow):
                 except Exception:
                     pass
         elif return_code == -1: # Stopped by user
-            self.status_bar.showMessage(f"{self.current_operation.capitalize()} stopped by user.", 5000)
+            self.show_status(f"{self.current_operation.capitalize()} stopped by user.", 5000)
             self.append_to_log(f"\n--- {self.current_operation.capitalize()} stopped by user. ---")
         else: # Error
             # Handle error using common error handler
@@ -557,25 +671,27 @@ class VehicleGUI(QMainWindow):
             QTimer.singleShot(500, self.counter_example_tab.refresh_from_cache)
         self.current_operation = None
 
+        if verify_next:
+            self._start_verify_step()
+
     def stop_current_operation(self):
         # Only stop if an operation is active
         if not self.current_operation:
             return
-        self.status_bar.showMessage(f"Attempting to stop {self.current_operation}...", 0)
+        self.show_status(f"Attempting to stop {self.current_operation}...", 0)
         self.stop_event.set()
         self.stop_button.setEnabled(False)
     
-    def _start_vcl_operation(self, operation_name: str):
+    def _start_vcl_operation(self, operation_name: str, save: bool = True):
         """Common logic to start a VCL compile or verify operation."""
         # Reset error state for new operation
         self._error_shown = False
 
-        if not self.save_before_operation():
+        if save and not self.save_before_operation():
             return
 
         self.input_view.assign_inputs(self.vcl_bindings)
-        loaded_resources = self.input_view.get_loaded_inputs()
-        if not all(loaded_resources):
+        if not self.input_view.all_inputs_loaded():
             QMessageBox.warning(self, "Resource Error", "Please load all required resources (networks, datasets, parameters) before compilation/verification")
             return
         
@@ -592,7 +708,7 @@ class VehicleGUI(QMainWindow):
             self.progress_bar.setValue(0)
             self.progress_bar.setMaximum(0)
 
-        self.status_bar.showMessage(f"Performing {operation_name.capitalize()}... Please wait.", 0)
+        self.show_status(f"Performing {operation_name.capitalize()}... Please wait.", 0)
         self.compile_button.setEnabled(False)
         self.verify_button.setEnabled(False)
         self.stop_button.setEnabled(True)
@@ -626,30 +742,31 @@ class VehicleGUI(QMainWindow):
         self.thread_pool.start(worker)
 
     def compile_spec(self):
+        # Large counterexample tensors are memory-mapped; unmap them before their files are deleted
+        self.counter_example_tab.release_cached_tensors()
         # Recursively clear cache directory
         for root, _, files in os.walk(CACHE_DIR, topdown=False):
             for name in files:
                 try:
                     os.remove(os.path.join(root, name))
                 except Exception as e:
-                    self.append_to_problems(f"Error clearing cache file {name}: {e}")
+                    self.append_to_log(f"Error clearing cache file {name}: {e}", color='red')
         self._start_vcl_operation("compile")
 
     def verify_spec(self):
-        self.compile_spec()  # Always compile before verify
+        # Always compile before verify; the verify step is started from the compile's finished handler
+        self._verify_after_compile = True
+        self.compile_spec()
         if self.current_operation is None:
-            return
-        # Wait for compilation to finish
-        while self.current_operation == "compile":
-            QApplication.processEvents()
+            self._verify_after_compile = False
 
-        # Abort verify if compile error occurred
-        if self._error_shown:
-            return
+    def _start_verify_step(self):
+        """Start verification once the compile step of verify_spec has succeeded."""
         if not self.vcl_bindings.verifier_path:
             QMessageBox.warning(self, "Verification Error", "Please set the verifier path first.")
             return
-        self._start_vcl_operation("verify")
+        # The compile step above already saved the specification
+        self._start_vcl_operation("verify", save=False)
 
     # --- Resource Management ---
 
@@ -702,10 +819,25 @@ class VehicleGUI(QMainWindow):
     def set_vcl_path(self, path):
         self.vcl_bindings.clear() # Clear any old bindings/data
         self.vcl_bindings.vcl_path = path
+        if path != self.vcl_path:
+            self.vcl_basename = os.path.basename(path)
         self.vcl_path = path
-        self.file_path_label.setText(f"File: {os.path.basename(path)}")
+        self.file_path_label.setText(f"File: {self.vcl_basename}")
         self.query_tab.clear() # Clear previous output for new file
 
+    def show_status(self, message, timeout: int = 0):
+        """Queue a status bar message (None clears it); only the latest queued message is shown."""
+        self._pending_status = (message, timeout)
+        self._status_timer.start()
+
+    def _flush_status(self):
+        """Show the most recently queued status message."""
+        message, timeout = self._pending_status
+        if message is None:
+            self.status_bar.clearMessage()
+        else:
+            self.status_bar.showMessage(message, timeout)
+
     def update_cursor_position(self):
         cursor = self.editor.textCursor()
         line = cursor.blockNumber() + 1
@@ -742,11 +874,9 @@ class VehicleGUI(QMainWindow):
             line = f"[{ts}] {message}"
         except Exception:
             line = message
-        # Wrap in color if specified
-        if color:
-            line = f'<span style="color:{color}">{line}</span>'
-        # Append rich text
-        self.log_console.append(line)
+        # Escape the text and keep its line breaks; wrap in color if specified
+        style = f"white-space:pre-wrap; color:{color}" if color else "white-space:pre-wrap"
+        self.log_console.appendHtml(f'<span style="{style}">{html.escape(line)}</span>')
         self.log_console.moveCursor(QTextCursor.MoveOperation.End)
         self.log_console.ensureCursorVisible()
         self.console_tab_widget.setCurrentWidget(self.log_console)
@@ -762,7 +892,7 @@ class VehicleGUI(QMainWindow):
             # Subsequent errors are logged only
             return
         # First error: clear status and halt operation
-        self.status_bar.clearMessage()
+        self.show_status(None)
         self._error_shown = True
         self.stop_current_operation()
         # Restore UI controls
@@ -778,40 +908,23 @@ class VehicleGUI(QMainWindow):
     def _process_json_chunk(self, chunk: str):
         """Accumulate and parse complete JSON objects from chunked output."""
         # Append new data to buffer
-        self._json_buffer += chunk
-        """
-        Accumulate and parse complete JSON objects from chunked output using brace matching.
-        """
-        buf = self._json_buffer
-        pos = 0
-        length = len(buf)
-        # Find JSON objects by matching braces
-        start = buf.find('{', pos)
-        while start != -1 and pos < length:
-            brace_count = 0
-            end = start
-            for i in range(start, length):
-                if buf[i] == '{':
-                    brace_count += 1
-                elif buf[i] == '}':
-                    brace_count -= 1
-                if brace_count == 0:
-                    end = i
-                    candidate = buf[start:end+1]
-                    try:
-                        obj = json.loads(candidate)
-                        self._handle_json_event(obj)
-                    except ValueError:
-                        # Incomplete or invalid JSON
-                        pass
-                    pos = end + 1
+        buf = self._json_buffer + chunk
+        start = buf.find('{')
+        while start != -1:
+            try:
+                # The C decoder finds the end of the object itself, braces inside strings included
+                obj, end = _JSON_DECODER.raw_decode(buf, start)
+            except json.JSONDecodeError as e:
+                # Failing within the last few characters (a cut literal or \u escape) or inside an open
+                # string means the object is still incomplete; wait for the next chunk
+                if len(buf) - e.pos < 6 or e.msg.startswith("Unterminated string"):
                     break
-            else:
-                # No complete JSON object found
-                break
-            start = buf.find('{', pos)
-        # Retain unprocessed part of buffer
-        self._json_buffer = buf[pos:]
+                start = buf.find('{', start + 1)    # Invalid JSON, resume at the next brace
+                continue
+            self._handle_json_event(obj)
+            start = buf.find('{', end)
+        # Retain only a trailing partial object
+        self._json_buffer = buf[start:] if start != -1 else ""
 
     def _init_property(self, prop: str, total: int):
         """Initialize progress bar for a new property."""
@@ -834,28 +947,22 @@ class VehicleGUI(QMainWindow):
                 self._handle_json_event(ev)
             return
         tag = event.get('tag')
+        contents = event.get('contents')
+        if not isinstance(contents, dict):
+            contents = {}
         # Human-readable logging for JSON events
         if tag == 'VerificationStart':
             self.append_to_log('Verification started', color='blue')
         elif tag == 'VerificationFinish':
             self.append_to_log('Verification finished successfully', color='blue')
         elif tag == 'MultiPropertyStart':
-            contents = event.get('contents')
-            if not isinstance(contents, dict):
-                contents = {}
             pname = contents.get('propertyName', '')
             self.append_to_log(f"Batch start for '{pname}'", color='blue')
         elif tag == 'MultiPropertyFinish':
-            contents = event.get('contents')
-            if not isinstance(contents, dict):
-                contents = {}
             pname = contents.get('propertyName', '')
             self.append_to_log(f"Batch finish for '{pname}'", color='blue')
         # Handle per-property progress
         if tag == 'PropertyStart':
-            contents = event.get('contents')
-            if not isinstance(contents, dict):
-                contents = {}
             prop = contents.get('propertyName', '')
             total = contents.get('numberOfQueries', 0)
             # Log property start
@@ -868,9 +975,6 @@ class VehicleGUI(QMainWindow):
             else:
                 init_prop()
         elif tag == 'QueryStart':
-            contents = event.get('contents')
-            if not isinstance(contents, dict):
-                contents = {}
             qid = contents.get('queryID', '')
             self.append_to_log(f"Query {qid} started", color='black')
             # Show halfway progress if available
@@ -878,9 +982,6 @@ class VehicleGUI(QMainWindow):
                 half_value = math.ceil(self.property_completed_queries + 0.5)
                 self.progress_bar.setValue(half_value)
         elif tag == 'QueryFinish':
-            contents = event.get('contents')
-            if not isinstance(contents, dict):
-                contents = {}
             qid = contents.get('queryID', '')
             # Increment completed queries
             self.property_completed_queries += 1
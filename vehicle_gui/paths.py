@@ -0,0 +1,10 @@
+"""
+Locations of the GUI's per-user files.
+
+Kept free of Qt and other package imports so the Vehicle worker script (_run_vcl.py) can load it directly.
+"""
+
+import os
+
+VEHICLE_DIR = os.path.join(os.path.expanduser("~"), ".vehicle", "GUI")
+CACHE_DIR = os.path.join(VEHICLE_DIR, "cache")
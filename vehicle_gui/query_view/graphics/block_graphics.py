@@ -10,6 +10,8 @@ Original author: Andrea Gimelli, Giacomo Rosato, Stefano Demarchi
 
 """
 
+from functools import lru_cache
+
 from PyQt6 import QtCore
 from PyQt6.QtCore import Qt, pyqtSignal, QObject
 from PyQt6.QtGui import QPen, QColor, QFont, QBrush, QPainterPath, QPainter
@@ -22,6 +24,24 @@ from ..verification.blocks import QueryBlock
 from ..base_types import Block
 
 
+@lru_cache(maxsize=None)
+def _block_pens_and_brushes(color_scheme: tuple) -> tuple:
+    """
+    Build the (default pen, hovered pen, selected pen, title brush, background brush) for a color scheme.
+    Schemes come from a small fixed palette, so blocks with the same status share one set.
+
+    """
+    pen_default = QPen(QColor(color_scheme[0]))
+    pen_default.setWidth(2)
+    pen_hovered = QPen(QColor(color_scheme[1]))
+    pen_hovered.setWidth(2)
+    pen_selected = QPen(QColor(color_scheme[2]))
+    pen_selected.setWidth(3)
+    pen_selected.setStyle(Qt.PenStyle.DotLine)
+    return (pen_default, pen_hovered, pen_selected,
+            QBrush(QColor(color_scheme[3])), QBrush(QColor(color_scheme[4])))
+
+
 class BlockSignals(QObject):
     """Signal emitter for block events"""
     query_double_clicked = pyqtSignal(str, str)  # path, title
@@ -52,15 +72,6 @@ class BlockGraphics(QGraphicsItem):
         # Style parameters
         self.color_scheme = []
         self.init_colors()
-        self._pen_default = QPen(QColor(self.color_scheme[0]))
-        self._pen_default.setWidth(2)
-        self._pen_hovered = QPen(QColor(self.color_scheme[1]))
-        self._pen_hovered.setWidth(2)
-        self._pen_selected = QPen(QColor(self.color_scheme[2]))
-        self._pen_selected.setWidth(3)
-        self._pen_selected.setStyle(Qt.PenStyle.DotLine)
-        self._brush_title = QBrush(QColor(self.color_scheme[3]))
-        self._brush_background = QBrush(QColor(self.color_scheme[4]))
 
         self.init_flags()
 
@@ -81,7 +92,21 @@ class BlockGraphics(QGraphicsItem):
         This method sets up the color scheme of the block
         using polymorphic behavior from the block itself
         """
-        self.color_scheme = self.block_ref.get_color_scheme()
+        self.set_color_scheme(self.block_ref.get_color_scheme())
+
+    def set_color_scheme(self, color_scheme) -> bool:
+        """
+        This method applies a color scheme to the block, returning
+        False if it is the one already in use
+
+        """
+        color_scheme = tuple(color_scheme)
+        if color_scheme == self.color_scheme:
+            return False
+        self.color_scheme = color_scheme
+        (self._pen_default, self._pen_hovered, self._pen_selected,
+         self._brush_title, self._brush_background) = _block_pens_and_brushes(color_scheme)
+        return True
 
     def init_graphics_content(self):
         """
@@ -1,7 +1,7 @@
 import os
 import json
 
-from PyQt6.QtWidgets import QTabWidget, QTextEdit, QTabBar, QSizePolicy, QWidget, QVBoxLayout, QComboBox, QLabel, QHBoxLayout, QSplitter
+from PyQt6.QtWidgets import QTabWidget, QPlainTextEdit, QTabBar, QSizePolicy, QWidget, QVBoxLayout, QComboBox, QLabel, QHBoxLayout, QSplitter
 from PyQt6.QtCore import pyqtSignal, Qt
 from pathlib import Path
 
@@ -64,30 +64,34 @@ class PropertyLoader:
             return self.workflow_generator.add_property(title=f"{title} (Error)")
     
     def _parse_node(self, parent_block, item):
-        """Parse a single item from the vcl-plan structure - relies on actual JSON structure"""
-        tag = item.get('tag', '')
-        contents = item.get('contents', {})
-        
-        if tag == 'Disjunct':
-            sub_items = contents.get('unDisjunctAll', [])
-            or_block = self.workflow_generator.add_or(parent_block)
-            for sub_item in sub_items:
-                self._parse_node(or_block, sub_item)
+        """Parse an item and its descendants from the vcl-plan structure - relies on actual JSON structure"""
+        workflow = self.workflow_generator
+        # Explicit DFS stack so deeply nested plans don't hit the recursion limit;
+        # children are pushed in reverse to keep blocks and query ids in document order
+        stack = [(parent_block, item)]
+        while stack:
+            parent_block, item = stack.pop()
+            tag = item.get('tag', '')
+            contents = item.get('contents', {})
 
-        elif tag == 'Conjunct':
-            sub_items = contents.get('unConjunctAll', [])
-            and_block = self.workflow_generator.add_and(parent_block)
-            for sub_item in sub_items:
-                self._parse_node(and_block, sub_item)
+            if tag == 'Disjunct':
+                sub_items = contents.get('unDisjunctAll', [])
+                or_block = workflow.add_or(parent_block)
+                stack.extend((or_block, sub_item) for sub_item in reversed(sub_items))
 
-        elif tag == 'Query':
-            queries = contents.get('queries', {}).get('unDisjunctAll', [])
-            negated = contents.get('negated', False)
-            
-            for _ in queries:
-                self.global_query_id += 1
-                query_path = os.path.join(CACHE_DIR, f"{self.property_name}-query{self.global_query_id}.txt")
-                self.workflow_generator.add_query(self.global_query_id, parent_block, query_path, is_negated=negated)
+            elif tag == 'Conjunct':
+                sub_items = contents.get('unConjunctAll', [])
+                and_block = workflow.add_and(parent_block)
+                stack.extend((and_block, sub_item) for sub_item in reversed(sub_items))
+
+            elif tag == 'Query':
+                queries = contents.get('queries', {}).get('unDisjunctAll', [])
+                negated = contents.get('negated', False)
+
+                for _ in queries:
+                    self.global_query_id += 1
+                    query_path = os.path.join(CACHE_DIR, f"{self.property_name}-query{self.global_query_id}.txt")
+                    workflow.add_query(self.global_query_id, parent_block, query_path, is_negated=negated)
 
 
 class QueryTab(QTabWidget):
@@ -173,10 +177,13 @@ class QueryTab(QTabWidget):
         properties = []
         self.property_dropdown.clear()
 
-        if self.cache_location.exists():
-            pattern = "*.vcl-plan"
-            plan_files = list(self.cache_location.glob(pattern))
-            properties.extend([f.stem for f in plan_files])
+        # One directory pass over plain names; no exists() probe or Path object per cache file
+        try:
+            with os.scandir(self.cache_location) as entries:
+                properties = [entry.name[:-len(".vcl-plan")] for entry in entries
+                              if entry.name.endswith(".vcl-plan") and entry.is_file()]
+        except FileNotFoundError:
+            pass
 
         self.property_dropdown.addItems(properties if properties else ["No properties found"])
     
@@ -210,7 +217,8 @@ class QueryTab(QTabWidget):
                 self._ensure_editor_visible()
                 return i
 
-        editor = QTextEdit()
+        # Query files can run to many thousands of lines; QPlainTextEdit lays them out per line cheaply
+        editor = QPlainTextEdit()
         editor.setReadOnly(True)
         editor.setPlainText(text)
         idx = self._editor_tabs.addTab(editor, title)
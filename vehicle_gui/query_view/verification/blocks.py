@@ -35,6 +35,10 @@ class Status(Enum):
     UNKNOWN = 2
 
 
+# Status colors looked up directly by status (the PALETTE keys match the member names)
+STATUS_PALETTE = {status: PALETTE[status.name] for status in Status}
+
+
 class PropertyQuantifier(Enum):
     """Property quantifier enumeration"""
     FOR_ALL = 0
@@ -89,21 +93,11 @@ class PropertyBlock(Block):
 
     def get_color_scheme(self):
         """Return color scheme based on verification status"""
-        key = "UNKNOWN"
-        if self.verification_status == Status.VERIFIED:
-            key = "VERIFIED"
-        elif self.verification_status == Status.DISPROVEN:
-            key = "DISPROVEN"
-        return PALETTE[key][0]
+        return STATUS_PALETTE[self.verification_status][0]
     
     def get_socket_colors(self):
         """Return socket colors for property blocks"""
-        key = "UNKNOWN"
-        if self.verification_status == Status.VERIFIED:
-            key = "VERIFIED"
-        elif self.verification_status == Status.DISPROVEN:
-            key = "DISPROVEN"
-        return PALETTE[key][1]
+        return STATUS_PALETTE[self.verification_status][1]
 
 
 class QueryBlock(Block):
@@ -119,21 +113,11 @@ class QueryBlock(Block):
     
     def get_color_scheme(self):
         """Return color scheme based on verification status"""
-        key = "UNKNOWN"
-        if self.verification_status == Status.VERIFIED:
-            key = "VERIFIED"
-        elif self.verification_status == Status.DISPROVEN:
-            key = "DISPROVEN"
-        return PALETTE[key][0]
+        return STATUS_PALETTE[self.verification_status][0]
     
     def get_socket_colors(self):
         """Return socket colors for query blocks"""
-        key = "UNKNOWN"
-        if self.verification_status == Status.VERIFIED:
-            key = "VERIFIED"
-        elif self.verification_status == Status.DISPROVEN:
-            key = "DISPROVEN"
-        return PALETTE[key][1]
+        return STATUS_PALETTE[self.verification_status][1]
 
 
 class WitnessBlock(Block):
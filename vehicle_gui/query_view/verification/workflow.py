@@ -6,9 +6,6 @@ that creates verification graphs from data.
 
 """
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPen, QColor, QBrush
-
 from .blocks import PropertyBlock, WitnessBlock, QueryBlock, PropertyQuantifier, Status, AndBlock, OrBlock
 from ..base_types import Scene, Socket
 from ..graphics.graphics_view import GraphicsView
@@ -161,17 +158,9 @@ class VerificationWorkflow:
     def _repaint_block(self, block):
         """Repaint a block's graphics to reflect updated verification status"""
         graphics = block.graphics
-        color_scheme = block.get_color_scheme()
-        graphics._pen_default = QPen(QColor(color_scheme[0]))
-        graphics._pen_default.setWidth(2)
-        graphics._pen_hovered = QPen(QColor(color_scheme[1]))
-        graphics._pen_hovered.setWidth(2)
-        graphics._pen_selected = QPen(QColor(color_scheme[2]))
-        graphics._pen_selected.setWidth(3)
-        graphics._pen_selected.setStyle(Qt.PenStyle.DotLine)
-        graphics._brush_title = QBrush(QColor(color_scheme[3]))
-        graphics._brush_background = QBrush(QColor(color_scheme[4]))
-        graphics.update()
+        # Pens and brushes are shared per color scheme; nothing to repaint if the status color is unchanged
+        if graphics.set_color_scheme(block.get_color_scheme()):
+            graphics.update()
 
     def _create_block_graphics(self, block):
         """Create graphics for a block and add to scene"""
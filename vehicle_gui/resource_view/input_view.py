@@ -1,7 +1,21 @@
 import os
-from PyQt6.QtCore import Qt, QSize, pyqtSignal
+import traceback
+from functools import lru_cache
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont, QFontDatabase, QIcon
-from PyQt6.QtWidgets import QVBoxLayout, QPushButton, QLabel, QLineEdit, QFrame, QFileDialog, QMessageBox, QSizePolicy, QHBoxLayout, QWidget, QScrollArea
+from PyQt6.QtWidgets import QVBoxLayout, QPushButton, QLabel, QLineEdit, QFrame, QMessageBox, QSizePolicy, QHBoxLayout, QWidget, QScrollArea
+
+from vehicle_gui.util import get_open_file_name
+
+
+@lru_cache(maxsize=None)
+def _mono_font(point_size, bold=False):
+    """Fixed-width system font, built once per size and weight and shared by every box"""
+    font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+    font.setPointSize(point_size)
+    if bold:
+        font.setWeight(QFont.Weight.Bold)
+    return font
 
 
 class InputBox(QFrame):
@@ -13,10 +27,7 @@ class InputBox(QFrame):
         self.setObjectName("InputBox")
         layout = QVBoxLayout()
         title = QLabel(f"{type_}: {name}")
-        mono = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-        mono.setPointSize(11)
-        mono.setWeight(QFont.Weight.Bold)
-        title.setFont(mono)
+        title.setFont(_mono_font(11, bold=True))
         layout.addWidget(title)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum)
 
@@ -43,6 +54,7 @@ class InputBox(QFrame):
 
         elif type_ == "Parameter":
             self.value = None       # Unset value is None
+            self._last_text = None  # Text set_value last handled
 
             self.input_box = QLineEdit()
             self.input_box.editingFinished.connect(self.set_value)
@@ -50,9 +62,7 @@ class InputBox(QFrame):
 
             # Add a label to show the data type
             self.data_type_label = QLabel(f"Data Type: {data_type}")
-            label_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-            label_font.setPointSize(10)
-            self.data_type_label.setFont(label_font)
+            self.data_type_label.setFont(_mono_font(10))
             self.data_type_label.setAlignment(Qt.AlignmentFlag.AlignRight)
             layout.addWidget(self.data_type_label)
             self.input_box.setPlaceholderText(f"Enter {self.data_type} value")
@@ -61,7 +71,7 @@ class InputBox(QFrame):
         self.setLayout(layout)
 
     def set_path(self):
-        """Open a dataset path"""
+        """Select a file for this input; only the path is stored, the file itself is never read here"""
         if self.type == "Network":
             file_filter = "ONNX Files (*.onnx);;All Files (*)"
         elif self.type == "Dataset":
@@ -69,8 +79,8 @@ class InputBox(QFrame):
         elif self.type == "Variable":
             file_filter = "Renderer modules (*.py);;All Files (*)"
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self, f"Open {self.type}", "", file_filter
+        file_path, _ = get_open_file_name(
+            self, f"Open {self.type}", file_filter
         )
         if not file_path:
             return
@@ -81,8 +91,12 @@ class InputBox(QFrame):
         self.load_status_changed.emit(True)
 
     def set_value(self):
-        value = self.input_box.text()
         """Set the value of the parameter"""
+        value = self.input_box.text()
+        # editingFinished fires on Return and again on focus loss (e.g. when an error dialog opens)
+        if value == self._last_text:
+            return
+        self._last_text = value
         if self.data_type == "Real":
             try:
                 value = float(value)
@@ -104,6 +118,7 @@ class InputBox(QFrame):
             raise ValueError(f"Unexpected data type: {self.data_type}")
 
         self.input_box.setText(str(value))
+        self._last_text = self.input_box.text()
         self.is_loaded = True
         self.value = value
         self.load_status_changed.emit(True)
@@ -116,6 +131,7 @@ class InputView(QWidget):
         super().__init__(parent)
         self.error_callback = error_callback or (lambda msg: print(f"Error: {msg}"))
         self.input_boxes = []
+        self._loaded_count = 0      # Boxes with is_loaded set, recounted whenever a box's load status changes
         # Store input state: name -> {"definition": {...}, "loaded": (path/value, display_text) or None}
         self._input_state = {}
 
@@ -159,19 +175,23 @@ class InputView(QWidget):
 
     def clear_input_boxes(self):
         """Delete all input boxes and recreate empty ones."""
-        self._remove_all_boxes()
-
-        # Recreate empty boxes from stored input definitions
-        for name, state in self._input_state.items():
-            definition = state["definition"]
-            type_ = definition.get("tag")
-            data_type = definition.get("typeText", None)
-            if not name or not type_:
-                continue
-            box = InputBox(name, type_, data_type=data_type)
-            box.load_status_changed.connect(self._update_status)
-            self.input_layout.addWidget(box)
-            self.input_boxes.append(box)
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            self._remove_all_boxes()
+
+            # Recreate empty boxes from stored input definitions
+            for name, state in self._input_state.items():
+                definition = state["definition"]
+                type_ = definition.get("tag")
+                data_type = definition.get("typeText", None)
+                if not name or not type_:
+                    continue
+                box = InputBox(name, type_, data_type=data_type)
+                box.load_status_changed.connect(self._update_status)
+                self.input_layout.addWidget(box)
+                self.input_boxes.append(box)
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
 
         self._update_status()
 
@@ -190,9 +210,16 @@ class InputView(QWidget):
                     self._input_state[box.name]["loaded"] = None
 
     def load_inputs(self, vcl_bindings):
-        """Load inputs from VCL bindings and create input boxes."""
+        """Load inputs from VCL bindings, reusing boxes for inputs that are unchanged."""
         self._save_loaded_state()
-        self._remove_all_boxes()
+
+        # Boxes whose input keeps its name, kind and data type are kept as they are
+        reusable = {(box.name, box.type, box.data_type): box for box in self.input_boxes}
+        # Lay out and paint the list once, after all boxes are in place
+        self.content_widget.setUpdatesEnabled(False)
+        while self.input_layout.count():
+            self.input_layout.takeAt(0)
+        self.input_boxes.clear()
 
         try:
             inputs = vcl_bindings.resources()
@@ -220,31 +247,40 @@ class InputView(QWidget):
                 if not name or not type_:
                     print(f"Skipping input entry with missing name or type: {definition}")
                     continue
-                box = InputBox(name, type_, data_type=data_type)
-                box.load_status_changed.connect(self._update_status)
+                box = reusable.pop((name, type_, data_type), None)
+                if box is None:
+                    box = self._create_box(name, type_, data_type, state["loaded"])
                 self.input_layout.addWidget(box)
                 self.input_boxes.append(box)
 
-                # Restore loaded state if it exists
-                if state["loaded"] is not None:
-                    value, display_text = state["loaded"]
-                    if type_ in ["Network", "Dataset", "Variable"]:
-                        box.path = value
-                        box.input_box.setText(display_text)
-                        box.input_box.setToolTip(value)  # Show full path on hover
-                        box.is_loaded = True
-                    elif type_ == "Parameter":
-                        box.value = value
-                        box.input_box.setText(display_text)
-                        box.is_loaded = True
-
         except Exception as e:
-            import traceback
             tb_str = traceback.format_exc()
             self.error_callback(f"Error generating input boxes: {e}\n{tb_str}")
+        finally:
+            # Delete boxes for inputs that are no longer in the specification
+            for box in reusable.values():
+                box.deleteLater()
+            self.content_widget.setUpdatesEnabled(True)
 
         self._update_status()
 
+    def _create_box(self, name, type_, data_type, loaded):
+        """Create an input box, restoring its loaded state if it exists."""
+        box = InputBox(name, type_, data_type=data_type)
+        box.load_status_changed.connect(self._update_status)
+        if loaded is not None:
+            value, display_text = loaded
+            if type_ in ["Network", "Dataset", "Variable"]:
+                box.path = value
+                box.input_box.setText(display_text)
+                box.input_box.setToolTip(value)  # Show full path on hover
+                box.is_loaded = True
+            elif type_ == "Parameter":
+                box.value = value
+                box.input_box.setText(display_text)
+                box.is_loaded = True
+        return box
+
     def assign_inputs(self, vcl_bindings):
         """Assign inputs from InputBox widgets to the VCLBindings object."""
         assigned = []
@@ -283,8 +319,12 @@ class InputView(QWidget):
         """Get list of loaded input names"""
         return [box.name for box in self.input_boxes if box.is_loaded]
 
+    def all_inputs_loaded(self):
+        """Return True if every input box has a value loaded"""
+        return self._loaded_count == len(self.input_boxes)
+
     def _update_status(self):
         """Update the status label with current input count."""
-        loaded = len([box for box in self.input_boxes if box.is_loaded])
+        self._loaded_count = sum(box.is_loaded for box in self.input_boxes)
         total = len(self.input_boxes)
-        self.status_label.setText(f"{loaded} / {total} inputs loaded")
\ No newline at end of file
+        self.status_label.setText(f"{self._loaded_count} / {total} inputs loaded")
\ No newline at end of file
@@ -1,6 +1,4 @@
-from pathlib import Path
-
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QComboBox, QLineEdit, QCheckBox, QFrame, QScrollArea
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QCheckBox, QFrame, QScrollArea
 from PyQt6.QtCore import Qt, pyqtSignal
 
 
@@ -88,18 +86,23 @@ class PropertyView(QWidget):
         self._properties = props
         self.property_widgets = {}
         
-        # Clear existing widgets
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Create property widgets
-        for prop in props:
-            prop_widget = PropertyBox(prop, self)
-            prop_widget.property_toggled.connect(self._on_property_toggled)
-            self.content_layout.addWidget(prop_widget)
-            self.property_widgets[prop['name']] = prop_widget
+        # Lay out and paint the list once, after all widgets are in place
+        self.content_widget.setUpdatesEnabled(False)
+        try:
+            # Clear existing widgets
+            while self.content_layout.count():
+                item = self.content_layout.takeAt(0)
+                if item.widget():
+                    item.widget().deleteLater()
+
+            # Create property widgets
+            for prop in props:
+                prop_widget = PropertyBox(prop, self)
+                prop_widget.property_toggled.connect(self._on_property_toggled)
+                self.content_layout.addWidget(prop_widget)
+                self.property_widgets[prop['name']] = prop_widget
+        finally:
+            self.content_widget.setUpdatesEnabled(True)
         
         self._update_status()
         self._emit_selection()
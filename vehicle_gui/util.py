@@ -1,5 +1,12 @@
 import os
 import sys
+from PyQt6.QtWidgets import QFileDialog
+
+# Directory of the last file picked in any dialog, where the next dialog starts
+_last_dir = os.path.expanduser("~")
+
+# Skip per-entry icon lookups and symlink resolution, which make listings crawl on network mounts
+FILE_DIALOG_OPTIONS = QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
 
 
 def which_all(cmd, mode=os.F_OK | os.X_OK, path=None):
@@ -36,4 +43,26 @@ def which_all(cmd, mode=os.F_OK | os.X_OK, path=None):
                 if rp not in seen:
                     seen.add(rp)
                     found.append(full)
-    return found
\ No newline at end of file
+    return found
+
+
+def get_open_file_name(parent, caption, file_filter):
+    """QFileDialog.getOpenFileName, starting in the directory of the last file chosen."""
+    global _last_dir
+    file_path, selected_filter = QFileDialog.getOpenFileName(
+        parent, caption, _last_dir, file_filter, options=FILE_DIALOG_OPTIONS
+    )
+    if file_path:
+        _last_dir = os.path.dirname(file_path)
+    return file_path, selected_filter
+
+
+def get_save_file_name(parent, caption, file_filter):
+    """QFileDialog.getSaveFileName, starting in the directory of the last file chosen."""
+    global _last_dir
+    file_path, selected_filter = QFileDialog.getSaveFileName(
+        parent, caption, _last_dir, file_filter, options=FILE_DIALOG_OPTIONS
+    )
+    if file_path:
+        _last_dir = os.path.dirname(file_path)
+    return file_path, selected_filter
@@ -1,16 +1,21 @@
 import os
 import re
 import sys
-import vehicle_lang as vcl
 import json
+import codecs
 import asyncio
 from vehicle_lang import VehicleError
-from typing import Sequence, Optional, Callable
+from typing import Sequence, Callable
+from vehicle_gui.vcl_utils import list_entities
 from vehicle_gui.vcl_utils import get_resources_info
 from vehicle_gui.vcl_utils import get_properties_info
-from vehicle_gui import VEHICLE_DIR
+from vehicle_gui.paths import CACHE_DIR
 
-CACHE_DIR = os.path.join(VEHICLE_DIR, "cache")
+# Position reported by the BNFC parser in syntax errors that are not JSON formatted
+_SYNTAX_ERROR_POSITION_RE = re.compile(r"line (\d+), column (\d+)")
+
+# Seconds to keep reading a stopped process's output before giving up on its pipes
+STOP_DRAIN_TIMEOUT = 2.0
 
 
 class Runner:
@@ -53,12 +58,18 @@ class Runner:
 		)
 
 		async def stream_output(stream, tag):
+			# Decode incrementally so multi-byte characters split across chunks stay intact
+			decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
 			while True:
 				data_chunk = await stream.read(4096)
 				if not data_chunk:
 					break
-				decoded = data_chunk.decode(errors="replace")
-				line_reader(tag, decoded)
+				decoded = decoder.decode(data_chunk)
+				if decoded:
+					line_reader(tag, decoded)
+			tail = decoder.decode(b"", final=True)
+			if tail:
+				line_reader(tag, tail)
 
 		async def watch_stop():
 			while True:
@@ -69,18 +80,30 @@ class Runner:
 						process.terminate()
 					except ProcessLookupError:
 						pass
+					return
 
 		stdout_task = asyncio.create_task(stream_output(process.stdout, "stdout"))
 		stderr_task = asyncio.create_task(stream_output(process.stderr, "stderr"))
 		stop_task = asyncio.create_task(watch_stop())
 
-		await asyncio.wait([stdout_task, stderr_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+		# Drain both pipes to EOF so trailing output on one isn't dropped when the other closes first
+		readers = asyncio.gather(stdout_task, stderr_task)
+		done, _ = await asyncio.wait({readers, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+		if stop_task in done:
+			# A solver started by the child can inherit its pipes and keep them open after the child
+			# is terminated, so only wait briefly for the remaining output (wait_for cancels the readers)
+			try:
+				await asyncio.wait_for(readers, STOP_DRAIN_TIMEOUT)
+			except asyncio.TimeoutError:
+				pass
+		else:
+			stop_task.cancel()
 
 		exit_code = await process.wait()
 		finish_fn(exit_code)
 
-	def run_sync(self, command: str, *args: str, **kwargs: str) -> str:
-		return asyncio.run(self.run(command, *args, **kwargs))
+	def run_sync(self, line_reader: Callable, finish_fn: Callable, stop_event: asyncio.Event):
+		return asyncio.run(self.run(line_reader, finish_fn, stop_event))
 
 
 class VCLBindings:
@@ -93,6 +116,7 @@ class VCLBindings:
 		self._datasets = {}
 		self._parameters = {}
 		self._properties = []
+		self._resources_cache = None	# (mtime_ns, resources) for the current VCL file
 
 	def compile(self, callback_fn: Callable, finish_fn: Callable, stop_event: asyncio.Event):
 		"""Compile a VCL specification"""
@@ -133,14 +157,15 @@ class VCLBindings:
 	def type_check(self):
 		"""Type check a VCL specification"""
 		try:
-			# Temporary method until type checking is fixed in vehicle_lang
-			vcl.list(self._vcl_path)
+			# Temporary method until type checking is fixed in vehicle_lang.
+			# Shares the cached listing with resources() and properties()
+			list_entities(self._vcl_path)
 		except VehicleError as e:
 			error_str = str(e)
 			error_json = json.loads(error_str)
 			if "provenance" not in error_json:
 				# error is not JSON formatted. This is a syntax error caught by BNFC parser
-				match = re.search(r"line (\d+), column (\d+)", error_str)
+				match = _SYNTAX_ERROR_POSITION_RE.search(error_str)
 				if match:
 					line, column = [int(g) for g in match.groups()]
 					start_col = max(1, column - 3)
@@ -161,26 +186,19 @@ class VCLBindings:
 
 	def resources(self):
 		"""Get the resources used by the VCLBindings"""
-		vcl_output = get_resources_info(self._vcl_path)
-		if not vcl_output:
-			raise VehicleError("No resources found in VCL file. Something is wrong.")
-		return json.loads(vcl_output)
+		mtime_ns = os.stat(self._vcl_path).st_mtime_ns
+		if self._resources_cache is None or self._resources_cache[0] != mtime_ns:
+			self._resources_cache = (mtime_ns, get_resources_info(self._vcl_path))
+		return self._resources_cache[1]
 
 	def properties(self):
 		"""Get the properties in the VCL specification"""
-		vcl_output = get_properties_info(self._vcl_path)
-		if not vcl_output:
-			return []
-		return json.loads(vcl_output)
+		return get_properties_info(self._vcl_path)
 	
 	def variables(self):
 		"""Get the quantified variables listed in the VCL specification"""
-		result = get_properties_info(self._vcl_path)
-		if not result:
-			return []
-		result = json.loads(result)
 		vars = set()
-		for item in result:
+		for item in get_properties_info(self._vcl_path):
 			vars = vars.union(set(item["quantifiedVariablesInfo"]))
 		return [{"name": var, "tag": "Variable"} for var in vars]
 
@@ -195,6 +213,7 @@ class VCLBindings:
 		# Check if the file exists
 		if os.path.isfile(value):
 			self._vcl_path = value
+			self._resources_cache = None
 		else:
 			raise FileNotFoundError(f"VCL file not found: {value}")
 
@@ -238,4 +257,5 @@ class VCLBindings:
 		self._datasets.clear()
 		self._parameters.clear()
 		self._properties.clear()
-		self._vcl_path = None
\ No newline at end of file
+		self._vcl_path = None
+		self._resources_cache = None
\ No newline at end of file
@@ -1,74 +1,93 @@
+import os
 import sys
 import json
+from functools import lru_cache
 from vehicle_lang.error import VehicleError
 from vehicle_lang.list import list
 from typing import Union
 from pathlib import Path
 
-def list_resources(specification: Union[str, Path]) -> str:
+@lru_cache(maxsize=32)
+def _list_entities(specification: str, mtime_ns: int, size: int) -> tuple:
+    """Run `vehicle list` once per version of a specification file"""
+    return tuple(json.loads(list(specification)))
+
+def list_entities(specification: Union[str, Path]) -> tuple:
+    """
+    List all entities in the specification, reusing the result while the file is unchanged.
+    :param specification: The path to the Vehicle specification file to list entities for.
+    :return: decoded entities.
+    """
+    stat = os.stat(specification)
+    return _list_entities(os.fspath(specification), stat.st_mtime_ns, stat.st_size)
+
+def list_resources(specification: Union[str, Path]) -> list:
     """
     List all networks, datasets, and non-inferable parameters in the specification.
     :param specification: The path to the Vehicle specification file to list resources for.
-    :return: list of entities as JSON.
+    :return: list of entities.
     """
     try:
-        result = json.loads(list(specification))
+        result = list_entities(specification)
         filtered_items = []
         for item in result:
             item_tag = item["tag"]            
             if item_tag == "Network" or item_tag == "Dataset" or (item_tag == "Parameter" and item["contents"]["inferable"] == False):
                 filtered_items.append(item)
-        return json.dumps(filtered_items, indent=2)
+        return filtered_items
     except VehicleError as e:
         raise VehicleError(f"Error listing resources: {e}")
 
-def list_properties(specification: Union[str, Path]) -> str:
+def list_properties(specification: Union[str, Path]) -> list:
     """
     List all properties in specification.
     :param specification: The path to the Vehicle specification file to list resources for.
-    :return: list of entities as JSON.
+    :return: list of entities.
     """
     try:
-        result = json.loads(list(specification))
+        result = list_entities(specification)
         filtered_items = []
         for item in result:
             item_tag = item["tag"]            
             if item_tag == "Property":
                 filtered_items.append(item)
-        return json.dumps(filtered_items, indent=2)
+        return filtered_items
     except VehicleError as e:
         raise VehicleError(f"Error listing resources: {e}")
 
-def get_resources_info(specification: Union[str, Path]) -> str:
+def get_resources_info(specification: Union[str, Path]) -> list:
     """
     Get resources info from the specification.
     :param specification: The path to the Vehicle specification file to get resources info for.
     :return: resources info.
     """
     try:
-        resources_json = json.loads(list_resources(specification))
+        resources_json = list_resources(specification)
         resources_info = []
         for item in resources_json:
-            resources_info.append({"tag": item["tag"], "name": item["contents"]["sharedData"]["name"], "typeText": item["contents"]["sharedData"]["typeText"]})
-        return json.dumps(resources_info, indent=2)
+            shared = item["contents"]["sharedData"]
+            resources_info.append({"tag": item["tag"], "name": shared["name"], "typeText": shared["typeText"]})
+        return resources_info
     except VehicleError as e:
         raise VehicleError(f"Error getting resources info: {e}")
 
-def get_properties_info(specification: Union[str, Path]) -> str:
+def get_properties_info(specification: Union[str, Path]) -> list:
     """
     Get properties info from the specification.
     :param specification: The path to the Vehicle specification file to get properties info for.
     :return: properties info.
     """
     try:
-        properties_json = json.loads(list_properties(specification))
+        properties_json = list_properties(specification)
         properties_info = []
         for item in properties_json:
-            quantified_var_names = [var["sharedData"]["name"] for var in item["contents"]["quantifiedVariables"]]
-            properties_info.append({"name": item["contents"]["sharedData"]["name"], 
+            contents = item["contents"]
+            shared = contents["sharedData"]
+            quantified_var_names = [var["sharedData"]["name"] for var in contents["quantifiedVariables"]]
+            properties_info.append({"name": shared["name"], 
                                     "quantifiedVariablesInfo": quantified_var_names,
-                                    "type": item["contents"]["sharedData"]["typeText"]})
-        return json.dumps(properties_info, indent=2)
+                                    "type": shared["typeText"]})
+        return properties_info
     except VehicleError as e:
         raise VehicleError(f"Error getting properties info: {e}")
 
@@ -79,7 +98,8 @@ if __name__ == "__main__":
         file_path = Path(__file__).parent.parent / "temp" / "temp.vcl"
     results = get_resources_info(file_path)
     print("--------------Resources---------------")
-    print(results)
-    print("--------------Properties---------------")
+    json.dump(results, sys.stdout, indent=2)
+    print("\n--------------Properties---------------")
     results = get_properties_info(file_path)
-    print(results)
\ No newline at end of file
+    json.dump(results, sys.stdout, indent=2)
+    sys.stdout.write("\n")
\ No newline at end of file